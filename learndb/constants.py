@@ -179,6 +179,23 @@ REAL_EPSILON = 0.00001
 CATALOG = "catalog"
 CATALOG_ROOT_PAGE_NUM = 0
 
+# equi-joins where the total number of input records exceeds this, are evaluated
+# as a sort-merge join, rather than a hash join; since the memory overhead
+# of the hash table dominates for large inputs
+SORT_MERGE_JOIN_THRESHOLD = 50000
+
+# number of records an expression is evaluated over at a time, when evaluated over a recordset;
+# this bounds the size of the intermediate (per node) value lists
+EVALUATION_BLOCK_SIZE = 4096
+
+# max number of compiled condition code objects cached (by generated source), i.e. the
+# cache is bounded, and the least recently used code objects are evicted
+COMPILED_SOURCE_CACHE_SIZE = 256
+
+# max number of derived schemas, e.g. scoped schema of an aliased table, cached by the virtual machine;
+# the least recently used derived schemas are evicted
+DERIVED_SCHEMA_CACHE_SIZE = 128
+
 USAGE = """
 Supported meta-commands:
 ------------------------
@@ -1,9 +1,18 @@
 import numbers
-from typing import Any, Union
+import operator
+import sys
+from functools import lru_cache
+from itertools import repeat
+from types import CodeType, MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
 
-from .constants import REAL_EPSILON
-from .datatypes import is_term_valid_for_datatype
-from .functions import resolve_scalar_func_name, resolve_aggregate_func_name
+from .constants import (
+    REAL_EPSILON,
+    EVALUATION_BLOCK_SIZE,
+    COMPILED_SOURCE_CACHE_SIZE,
+)
+from .datatypes import DataType, Integer, Real, Text
+from .functions import get_scalar_function, get_aggregate_function
 from .lang_parser.visitor import Visitor
 from .lang_parser.symbols import (
     Symbol,
@@ -17,15 +26,205 @@ from .lang_parser.symbols import (
     ArithmeticOp,
     FuncCall,
     Expr,
+    SymbolicDataType,
 )
 
 from .name_registry import NameRegistry
 from .record_utils import (
+    JoinedRecordView,
     SimpleRecord,
     ScopedRecord,
     GroupedRecord,
 )
-from .vm_utils import EvalMode, datatype_from_symbolic_datatype
+from .schema import AbstractSchema, SimpleSchema, ScopedSchema
+from .vm_utils import EvalMode
+
+
+# comparison operator -> function evaluating strict comparison, i.e. evaluate_strict_comparison
+STRICT_COMPARISON_FUNCTIONS = {
+    ComparisonOp.Equal: operator.eq,
+    ComparisonOp.NotEqual: operator.ne,
+    ComparisonOp.Greater: operator.gt,
+    ComparisonOp.Less: operator.lt,
+    ComparisonOp.GreaterEqual: operator.ge,
+    ComparisonOp.LessEqual: operator.le,
+}
+
+# comparison operator -> function evaluating fuzzy comparison, i.e. evaluate_fuzzy_comparison
+FUZZY_COMPARISON_FUNCTIONS = {
+    ComparisonOp.Equal: lambda left, right, epsilon: abs(left - right) <= epsilon,
+    ComparisonOp.NotEqual: lambda left, right, epsilon: abs(left - right) > epsilon,
+    ComparisonOp.Greater: lambda left, right, epsilon: left + epsilon > right,
+    ComparisonOp.Less: lambda left, right, epsilon: left - epsilon < right,
+    ComparisonOp.GreaterEqual: lambda left, right, epsilon: left + epsilon >= right,
+    ComparisonOp.LessEqual: lambda left, right, epsilon: left - epsilon <= right,
+}
+
+
+def divide(dividend: Union[int, float], divisor: Union[int, float]):
+    """
+    Divide; integers are floor divided
+    """
+    if isinstance(dividend, int):
+        return dividend // divisor
+    return dividend / divisor
+
+
+# type of dividend -> division operator, i.e. equivalent of divide for dividends of the type
+DIVISION_FUNCTIONS = {
+    int: operator.floordiv,
+    float: operator.truediv,
+}
+
+# arithmetic operator -> function evaluating operator
+ARITHMETIC_FUNCTIONS = {
+    ArithmeticOp.Addition: operator.add,
+    ArithmeticOp.Subtraction: operator.sub,
+    ArithmeticOp.Multiplication: operator.mul,
+    ArithmeticOp.Division: divide,
+}
+
+
+def make_comparator(comparison_op: ComparisonOp) -> Callable[[Any, Any], bool]:
+    """
+    Create function that evaluates `comparison_op` over (evaluated) operands.
+    NOTE: the returned function is specialized for the operator, i.e. evaluating
+    it doesn't branch on the operator
+    """
+    strict_compare = STRICT_COMPARISON_FUNCTIONS[comparison_op]
+    fuzzy_compare = FUZZY_COMPARISON_FUNCTIONS[comparison_op]
+
+    if comparison_op == ComparisonOp.Equal or comparison_op == ComparisonOp.NotEqual:
+        # equality and inequality can be for any datatypes
+        def compare(left_value: Any, right_value: Any) -> bool:
+            if (
+                isinstance(left_value, float)
+                and abs(left_value - right_value) <= REAL_EPSILON
+            ):
+                return fuzzy_compare(left_value, right_value, REAL_EPSILON)
+            return strict_compare(left_value, right_value)
+
+    else:
+        # less than etc. comparisons are only defined for numeric types
+        def compare(left_value: Any, right_value: Any) -> bool:
+            assert isinstance(left_value, numbers.Number) and isinstance(
+                right_value, numbers.Number
+            )
+            if (
+                isinstance(left_value, float)
+                and abs(left_value - right_value) <= REAL_EPSILON
+            ):
+                return fuzzy_compare(left_value, right_value, REAL_EPSILON)
+            return strict_compare(left_value, right_value)
+
+    return compare
+
+
+# python type (of evaluated value) -> symbolic datatype; used to create literals
+PYTHON_TYPE_TO_SYMBOLIC_DATATYPE = {
+    bool: SymbolicDataType.Boolean,
+    int: SymbolicDataType.Integer,
+    float: SymbolicDataType.Real,
+    str: SymbolicDataType.Text,
+}
+
+# python type (of literal value) -> datatype; used to type the operands of predicates
+PYTHON_TYPE_TO_DATATYPE = {
+    int: Integer,
+    float: Real,
+    str: Text,
+}
+
+# comparison operator -> python operator; used to generate source of comparisons between integers
+INTEGER_COMPARISON_SOURCE_OPERATORS = {
+    ComparisonOp.Equal: "==",
+    ComparisonOp.NotEqual: "!=",
+    ComparisonOp.Greater: ">",
+    ComparisonOp.Less: "<",
+    ComparisonOp.GreaterEqual: ">=",
+    ComparisonOp.LessEqual: "<=",
+}
+
+# arithmetic operator -> python operator; used to generate source of arithmetic between integers
+INTEGER_ARITHMETIC_SOURCE_OPERATORS = {
+    ArithmeticOp.Addition: "+",
+    ArithmeticOp.Subtraction: "-",
+    ArithmeticOp.Multiplication: "*",
+    ArithmeticOp.Division: "//",
+}
+
+
+@lru_cache(maxsize=COMPILED_SOURCE_CACHE_SIZE)
+def compile_condition_source(source: str) -> CodeType:
+    """
+    Compile generated `source` of a condition over record `r`, into a code object; see compile_condition.
+    NOTE: the code object only depends on the source; hence code objects are cached by source.
+    The cache is bounded, since it outlives statements and scopes
+    """
+    return compile(f"lambda r: {source}", "<condition>", "eval")
+
+
+# comparison operator -> comparator
+COMPARATORS = {
+    comparison_op: make_comparator(comparison_op) for comparison_op in ComparisonOp
+}
+
+# named args of a function call; we currently only support positional args.
+# NOTE: shared by all function calls, rather than allocating an empty dict per call; hence read-only
+NO_NAMED_ARGS = MappingProxyType({})
+
+
+class ConditionCompilation:
+    """
+    State of a condition being compiled; see ExpressionInterpreter.compile_condition
+    """
+
+    __slots__ = (
+        "namespace",
+        "generate_column_source",
+        "is_integer_column",
+        "occurrences",
+        "temporaries",
+        "evaluated",
+    )
+
+    def __init__(
+        self,
+        is_integer_column: Callable[[str], bool],
+        occurrences: Dict[str, int],
+    ):
+        # name -> object referenced by generated source
+        self.namespace = {}
+        # column name -> source that reads column value from record `r`; set by the compiler
+        self.generate_column_source: Optional[Callable[[str], str]] = None
+        # column name -> whether the column's value is always an integer, i.e. never null
+        self.is_integer_column = is_integer_column
+        # subexpression key -> number of occurrences in condition
+        self.occurrences = occurrences
+        # subexpression key -> name of local holding its value
+        self.temporaries = {}
+        # keys of subexpressions whose local is assigned (on every evaluation) by source generated so far
+        self.evaluated = set()
+
+    def bind(self, obj: Any) -> str:
+        """
+        Bind `obj` to a name in the namespace of the generated source
+        """
+        name = f"v{len(self.namespace)}"
+        self.namespace[name] = obj
+        return name
+
+
+# symbol classes whose handlers are bound when the interpreter is created
+EXPRESSION_SYMBOL_CLASSES = (
+    OrClause,
+    AndClause,
+    Comparison,
+    BinaryArithmeticOperation,
+    FuncCall,
+    ColumnName,
+    Literal,
+)
 
 
 class ExpressionInterpreter(Visitor):
@@ -37,14 +236,32 @@ class ExpressionInterpreter(Visitor):
     evaluating expressions to value, to booleans, determining expression type, and other utils like stringify exprs.
     """
 
+    __slots__ = (
+        "name_registry",
+        "mode",
+        "record",
+        "dispatch",
+        "operation_plans",
+        "func_call_plans",
+    )
+
     def __init__(self, name_registry: NameRegistry):
         self.name_registry = name_registry
         # mode determines whether this is evaluating an expr over a scalar record, or a grouped recordset
         self.mode = None
         self.record = None
+        # symbol class -> bound handler
+        self.dispatch = {}
+        for symbol_class in EXPRESSION_SYMBOL_CLASSES:
+            self.bind_handler(symbol_class, self.dispatch)
+        # id(operation) -> (operation, operator function, left operand getter, right operand getter)
+        self.operation_plans: Dict[
+            int, Tuple[Symbol, Callable, Callable, Callable]
+        ] = {}
+        # id(func_call) -> (func_call, specialized function call)
+        self.func_call_plans: Dict[int, Tuple[FuncCall, Callable[[Any], Any]]] = {}
 
     def set_record(self, record):
-        self.name_registry.set_record(record)
         self.record = record
 
     # evaluation
@@ -53,8 +270,11 @@ class ExpressionInterpreter(Visitor):
         """
         execute statement. NOTE: evaluation is affected by: 1) mode and 2) record that expression is evaluated over
         """
-        return_value = expr.accept(self)
-        return return_value
+        # NOTE: dispatch directly via the bound handler table, rather than via expr.accept or visit
+        handler = self.dispatch.get(expr.__class__)
+        if handler is None:
+            handler = self.bind_handler(expr.__class__, self.dispatch)
+        return handler(expr)
 
     def evaluate_over_no_record(self, expr: Symbol):
         """
@@ -71,8 +291,13 @@ class ExpressionInterpreter(Visitor):
         Evaluate `expr` over `record` i.e. evaluating any column references from value in `record`
         """
         self.mode = EvalMode.Scalar
-        self.set_record(record)
-        return self.evaluate(expr)
+        # NOTE: this is called per record; hence the record is set, and the root is dispatched, inline;
+        # i.e. equivalent to set_record, and evaluate
+        self.record = record
+        handler = self.dispatch.get(expr.__class__)
+        if handler is None:
+            return self.evaluate(expr)
+        return handler(expr)
 
     def evaluate_over_grouped_record(self, expr: Symbol, record: GroupedRecord):
         """
@@ -82,6 +307,765 @@ class ExpressionInterpreter(Visitor):
         self.set_record(record)
         return self.evaluate(expr)
 
+    # section: batch evaluation
+
+    def evaluate_over_recordset(
+        self, expr: Symbol, records: List[Union[SimpleRecord, ScopedRecord]]
+    ) -> List[Any]:
+        """
+        Evaluate `expr` over each record in `records`, and return the list of values, i.e. one value per record.
+
+        NOTE: evaluate_over_record walks the expr tree once per record, i.e. the dispatch cost is paid per
+        node per record. Instead, this walks the tree once, and evaluates each node over the entire batch of
+        records, i.e. column-at-a-time. The rows each node is evaluated over are tracked by a selection vector,
+        i.e. a list of indices into `records`, so that and/or clauses only evaluate later predicates on rows
+        that haven't already been decided- i.e. the short-circuiting semantics of evaluate_over_record are preserved.
+
+        NOTE: records are evaluated in blocks of EVALUATION_BLOCK_SIZE; so that the value lists of the
+        nodes being evaluated stay small (cache-sized), while column values are still accessed contiguously.
+        """
+        expr = self.fold_constants(expr)
+        self.mode = EvalMode.Scalar
+        values = []
+        for start in range(0, len(records), EVALUATION_BLOCK_SIZE):
+            end = min(start + EVALUATION_BLOCK_SIZE, len(records))
+            values.extend(self.evaluate_batch(expr, records, range(start, end)))
+        return values
+
+    def evaluate_batch(
+        self,
+        expr: Symbol,
+        records: List[Union[SimpleRecord, ScopedRecord]],
+        selection: Sequence[int],
+    ) -> List[Any]:
+        """
+        Evaluate `expr` over records in `records` at indices `selection`.
+        Returns list of values aligned with `selection`.
+        """
+        if isinstance(expr, Expr):
+            return self.evaluate_batch(expr.expr, records, selection)
+        elif isinstance(expr, ColumnName):
+            name = expr.name
+            if selection and hasattr(records, "column"):
+                # records is a recordset, which can materialize (and cache) the column
+                column = records.column(name)
+                if isinstance(selection, range) and selection.step == 1:
+                    # NOTE: contiguous selection, e.g. a block; slice the column
+                    return column[selection.start : selection.stop]
+                return [column[index] for index in selection]
+            return [records[index].get(name) for index in selection]
+        elif isinstance(expr, Literal):
+            return [self.visit_literal(expr)] * len(selection)
+        elif isinstance(expr, Comparison):
+            left_values = self.evaluate_batch(expr.left_op, records, selection)
+            right_op = expr.right_op
+            while isinstance(right_op, Expr):
+                right_op = right_op.expr
+            if isinstance(right_op, Literal):
+                # NOTE: comparison with a constant, e.g. cola > 5; the constant is repeated
+                # rather than materialized into a list, and its type is checked once
+                right_value = right_op.value
+                right_values = repeat(right_value, len(left_values))
+                is_strict = self.is_strict_comparison_batch(
+                    expr, left_values, (right_value,)
+                )
+            else:
+                right_values = self.evaluate_batch(expr.right_op, records, selection)
+                is_strict = self.is_strict_comparison_batch(
+                    expr, left_values, right_values
+                )
+            if is_strict:
+                # NOTE: map over a builtin operator function evaluates in C
+                return list(
+                    map(
+                        STRICT_COMPARISON_FUNCTIONS[expr.operator],
+                        left_values,
+                        right_values,
+                    )
+                )
+            return list(map(COMPARATORS[expr.operator], left_values, right_values))
+        elif isinstance(expr, BinaryArithmeticOperation):
+            operand1_values = self.evaluate_batch(expr.operand1, records, selection)
+            operand2_values = self.evaluate_batch(expr.operand2, records, selection)
+            arithmetic_function = ARITHMETIC_FUNCTIONS[expr.operator]
+            if expr.operator == ArithmeticOp.Division:
+                # NOTE: divide checks the type of each dividend; if all dividends have the same type,
+                # the (builtin) division operator is resolved once for the batch
+                dividend_types = set(map(type, operand1_values))
+                if len(dividend_types) == 1:
+                    arithmetic_function = DIVISION_FUNCTIONS.get(
+                        dividend_types.pop(), divide
+                    )
+            return list(map(arithmetic_function, operand1_values, operand2_values))
+        elif isinstance(expr, FuncCall):
+            func = get_scalar_function(expr.name)
+            assert func is not None
+            apply = func.apply
+            # NOTE: args are evaluated column-at-a-time; the function is applied per record
+            arg_values = [
+                self.evaluate_batch(arg, records, selection) for arg in expr.args
+            ]
+            if not arg_values:
+                return [apply((), NO_NAMED_ARGS) for _ in selection]
+            if len(arg_values) == 1:
+                # NOTE: most functions take a single arg; avoid zipping
+                return [apply((value,), NO_NAMED_ARGS) for value in arg_values[0]]
+            # NOTE: positional args are passed as the tuples zip creates
+            return [apply(args, NO_NAMED_ARGS) for args in zip(*arg_values)]
+        elif isinstance(expr, AndClause):
+            return self.evaluate_batch_logical_clause(
+                expr, expr.predicates, False, records, selection
+            )
+        elif isinstance(expr, OrClause):
+            return self.evaluate_batch_logical_clause(
+                expr, expr.and_clauses, True, records, selection
+            )
+        else:
+            # NOTE: other exprs are evaluated record-at-a-time
+            evaluate_over_record = self.evaluate_over_record
+            return [evaluate_over_record(expr, records[index]) for index in selection]
+
+    @staticmethod
+    def is_strict_comparison_batch(
+        comparison: Comparison,
+        left_values: Sequence[Any],
+        right_values: Sequence[Any],
+    ) -> bool:
+        """
+        Return True if `comparison` over each pair of values from `left_values` and `right_values`
+        is a strict comparison (see compare), i.e. can be evaluated with STRICT_COMPARISON_FUNCTIONS.
+        This is the case for integer left values compared with numeric right values. Equality and
+        inequality also hold for any non-real left values.
+        """
+        left_types = set(map(type, left_values))
+        if (
+            comparison.operator == ComparisonOp.Equal
+            or comparison.operator == ComparisonOp.NotEqual
+        ):
+            return float not in left_types
+        return left_types <= {int} and set(map(type, right_values)) <= {int, float}
+
+    def evaluate_batch_logical_clause(
+        self,
+        clause: Union[AndClause, OrClause],
+        children: List[Symbol],
+        decisive_value: bool,
+        records: List[Union[SimpleRecord, ScopedRecord]],
+        selection: Sequence[int],
+    ) -> List[Any]:
+        """
+        Evaluate and/or `clause` over records at `selection`. `decisive_value` is the
+        child value that decides the entire clause, i.e. False for and-clause, and True for or-clause.
+        Each child is only evaluated over the rows that are still undecided.
+        NOTE: rows where a child evaluates to a non-bool value are evaluated record-at-a-time,
+        since the semantics of and/or over non-bool values are handled by visit_and_clause and visit_or_clause
+        """
+        values = [not decisive_value] * len(selection)
+        # positions (in `selection`) of undecided rows
+        positions = list(range(len(selection)))
+        for child in children:
+            if not positions:
+                break
+            child_values = self.evaluate_batch(
+                child, records, [selection[pos] for pos in positions]
+            )
+            undecided = []
+            for pos, value in zip(positions, child_values):
+                if value is decisive_value:
+                    values[pos] = decisive_value
+                elif isinstance(value, bool):
+                    undecided.append(pos)
+                else:
+                    values[pos] = self.evaluate_over_record(
+                        clause, records[selection[pos]]
+                    )
+            positions = undecided
+        return values
+
+    # section: compiled evaluation
+
+    def compile_condition(
+        self,
+        expr: Symbol,
+        schema: Optional[AbstractSchema] = None,
+    ) -> Callable[[Union[SimpleRecord, ScopedRecord]], Any]:
+        """
+        Compile `expr`, e.g. a where condition or a selectable, into a function that evaluates `expr`
+        over a (scalar) record.
+
+        NOTE: evaluate_over_record dispatches on every node of `expr`, for every record. This instead
+        walks the tree once, and generates the source of a python lambda, which is compiled to bytecode, i.e.
+        evaluating the condition makes no interpreter calls. Operators are bound to their (operator specialized)
+        functions, and and/or clauses are compiled to python and/or, which have the same short-circuiting
+        semantics as visit_and_clause/visit_or_clause. Nodes that are not compiled are evaluated by the interpreter.
+
+        `schema`, if passed, is the records' schema; i.e. the condition is specialized for the schema:
+        column references are resolved against the schema once, and generated as direct reads of the
+        record's values (see generate_record_column_source). Further, comparisons and arithmetic between
+        integer operands, i.e. non-nullable integer columns and integer literals, are generated as python
+        operators, since integers are compared strictly (see compare). Otherwise, columns are read via record.get.
+
+        NOTE: a subexpression that occurs multiple times in `expr`, e.g. `cola + 1` in
+        `cola + 1 > 2 or cola + 1 < 0`, is evaluated once per record, i.e. its value is assigned to
+        a local and later occurrences read the local; if the first occurrence is always evaluated.
+
+        NOTE: the generated source only depends on the shape of `expr` (and operand types), since
+        all objects are referenced by generated names; hence the compiled code is cached by source.
+        """
+        compilation = self.init_compilation(
+            expr, lambda name: self.is_non_null_integer_column(schema, name)
+        )
+        compilation.generate_column_source = (
+            lambda name: self.generate_record_column_source(
+                "r", schema, name, compilation.bind
+            )
+        )
+        return self.compile_source(expr, compilation)
+
+    def compile_join_condition(
+        self,
+        expr: Symbol,
+        schema: ScopedSchema,
+        left_schema: Union[SimpleSchema, ScopedSchema],
+        right_schema: Union[SimpleSchema, ScopedSchema],
+        left_alias: Optional[str],
+        right_alias: str,
+    ) -> Callable[[JoinedRecordView], Any]:
+        """
+        Compile join condition `expr` into a function that evaluates `expr` over a JoinedRecordView
+        of a pair of records with `left_schema` and `right_schema`; `schema` is the joined schema.
+        Like compile_condition; however, a column reference is resolved to a side of the view (like
+        JoinedRecordView.get), and the side's schema, once.
+        """
+
+        def is_integer_column(name: str) -> bool:
+            parts = name.split(".")
+            if len(parts) != 2:
+                return False
+            table, column = parts
+            if table == right_alias:
+                return self.is_non_null_integer_column(right_schema, column)
+            elif table == left_alias:
+                return self.is_non_null_integer_column(left_schema, column)
+            return False
+
+        compilation = self.init_compilation(expr, is_integer_column)
+        bind = compilation.bind
+
+        def generate_column_source(name: str) -> str:
+            parts = name.split(".")
+            if len(parts) != 2:
+                # NOTE: invalid name; let the view raise
+                return f"r.get({bind(name)})"
+            table, column = parts
+            if table == right_alias:
+                record_source, side_schema = "r.right_rec", right_schema
+            elif isinstance(left_schema, ScopedSchema) or table == left_alias:
+                record_source, side_schema = "r.left_rec", left_schema
+            else:
+                return f"r.get({bind(name)})"
+            # NOTE: simple records are keyed by the unqualified column name
+            if isinstance(side_schema, SimpleSchema):
+                name = column
+            return self.generate_record_column_source(
+                record_source, side_schema, name, bind
+            )
+
+        compilation.generate_column_source = generate_column_source
+        return self.compile_source(expr, compilation)
+
+    def init_compilation(
+        self, expr: Symbol, is_integer_column: Callable[[str], bool]
+    ) -> ConditionCompilation:
+        """
+        Create compilation state for compiling `expr`
+        """
+        occurrences = {}
+        self.count_subexpressions(expr, occurrences)
+        return ConditionCompilation(is_integer_column, occurrences)
+
+    def compile_source(
+        self, expr: Symbol, compilation: ConditionCompilation
+    ) -> Callable[[Any], Any]:
+        """
+        Generate source for `expr`, and compile it into a function over record `r`
+        """
+        source = self.generate_condition_source(expr, compilation, True)
+        return eval(compile_condition_source(source), compilation.namespace)
+
+    @staticmethod
+    def generate_record_column_source(
+        record_source: str,
+        schema: Union[SimpleSchema, ScopedSchema, None],
+        name: str,
+        bind: Callable[[Any], str],
+    ) -> str:
+        """
+        Generate source that reads the value of column `name` from the record (with `schema`)
+        that `record_source` evaluates to. This is equivalent to record.get(name), but resolves the
+        name against the schema once; see make_column_getter, incl. why names are interned
+        """
+        if isinstance(schema, SimpleSchema):
+            # simple records are keyed by lowercased column name
+            return f"{record_source}.values[{bind(sys.intern(name.lower()))}]"
+
+        parts = name.split(".")
+        if (
+            isinstance(schema, ScopedSchema)
+            and len(parts) == 2
+            and isinstance(schema.schemas.get(parts[0]), SimpleSchema)
+        ):
+            alias = bind(sys.intern(parts[0]))
+            key = bind(sys.intern(parts[1].lower()))
+            return f"{record_source}.names[{alias}].values[{key}]"
+
+        # NOTE: any other case, e.g. nested scoped records, is resolved by the record
+        return f"{record_source}.get({bind(sys.intern(str(name)))})"
+
+    @classmethod
+    def count_subexpressions(cls, expr: Symbol, occurrences: Dict[str, int]):
+        """
+        Count occurrences of each subexpression of `expr`, keyed by subexpression key (see
+        get_subexpression_key), into `occurrences`
+        """
+        if isinstance(expr, Expr):
+            cls.count_subexpressions(expr.expr, occurrences)
+            return
+        if isinstance(expr, (ColumnName, Literal)):
+            return
+
+        if not isinstance(expr, (AndClause, OrClause)):
+            key = cls.get_subexpression_key(expr)
+            occurrences[key] = occurrences.get(key, 0) + 1
+
+        if isinstance(expr, (AndClause, OrClause)):
+            children = cls.get_logical_clause_children(expr)
+        elif isinstance(expr, Comparison):
+            children = [expr.left_op, expr.right_op]
+        elif isinstance(expr, BinaryArithmeticOperation):
+            children = [expr.operand1, expr.operand2]
+        elif isinstance(expr, FuncCall):
+            children = expr.args
+        else:
+            children = []
+        for child in children:
+            cls.count_subexpressions(child, occurrences)
+
+    @staticmethod
+    def get_subexpression_key(expr: Symbol) -> str:
+        """
+        Return key of subexpression; structurally equal subexpressions have the same key
+        """
+        return repr(expr)
+
+    def generate_condition_source(
+        self, expr: Symbol, compilation: ConditionCompilation, unconditional: bool
+    ) -> str:
+        """
+        Generate python source of an expression, over record `r`, that evaluates `expr`.
+        Any objects the source references are bound via `compilation`.
+        `unconditional` is whether the generated source is evaluated on every evaluation of
+        the condition, i.e. it isn't short-circuited by an enclosing and/or clause
+        """
+        if isinstance(expr, Expr):
+            return self.generate_condition_source(expr.expr, compilation, unconditional)
+        if isinstance(expr, (ColumnName, Literal, AndClause, OrClause)):
+            return self.generate_node_source(expr, compilation, unconditional)
+
+        key = self.get_subexpression_key(expr)
+        if compilation.occurrences.get(key, 0) < 2:
+            return self.generate_node_source(expr, compilation, unconditional)
+        if key in compilation.evaluated:
+            # subexpression has already been evaluated; read its value
+            return compilation.temporaries[key]
+
+        temporary = compilation.temporaries.setdefault(
+            key, f"t{len(compilation.temporaries)}"
+        )
+        source = self.generate_node_source(expr, compilation, unconditional)
+        if unconditional:
+            compilation.evaluated.add(key)
+        return f"({temporary} := {source})"
+
+    def generate_node_source(
+        self, expr: Symbol, compilation: ConditionCompilation, unconditional: bool
+    ) -> str:
+        """
+        Generate python source that evaluates node `expr`; see generate_condition_source
+        """
+        bind = compilation.bind
+        if isinstance(expr, ColumnName):
+            return compilation.generate_column_source(expr.name)
+
+        elif isinstance(expr, Literal):
+            return bind(self.visit_literal(expr))
+
+        elif isinstance(expr, Comparison):
+            left = self.generate_condition_source(
+                expr.left_op, compilation, unconditional
+            )
+            right = self.generate_condition_source(
+                expr.right_op, compilation, unconditional
+            )
+            if self.is_integer_operand(
+                expr.left_op, compilation.is_integer_column
+            ) and self.is_integer_operand(expr.right_op, compilation.is_integer_column):
+                source_operator = INTEGER_COMPARISON_SOURCE_OPERATORS[expr.operator]
+                return f"({left} {source_operator} {right})"
+            return f"{bind(COMPARATORS[expr.operator])}({left}, {right})"
+
+        elif isinstance(expr, BinaryArithmeticOperation):
+            operand1 = self.generate_condition_source(
+                expr.operand1, compilation, unconditional
+            )
+            operand2 = self.generate_condition_source(
+                expr.operand2, compilation, unconditional
+            )
+            if self.is_integer_operand(expr, compilation.is_integer_column):
+                source_operator = INTEGER_ARITHMETIC_SOURCE_OPERATORS[expr.operator]
+                return f"({operand1} {source_operator} {operand2})"
+            arithmetic_function = bind(ARITHMETIC_FUNCTIONS[expr.operator])
+            return f"{arithmetic_function}({operand1}, {operand2})"
+
+        elif isinstance(expr, FuncCall) and get_scalar_function(expr.name) is not None:
+            # NOTE: args are generated inline, i.e. the positional args tuple is built directly
+            apply = bind(get_scalar_function(expr.name).apply)
+            no_named_args = bind(NO_NAMED_ARGS)
+            args = [
+                self.generate_condition_source(arg, compilation, unconditional)
+                for arg in expr.args
+            ]
+            if len(args) == 1:
+                return f"{apply}(({args[0]},), {no_named_args})"
+            return f"{apply}(({', '.join(args)}), {no_named_args})"
+
+        elif isinstance(expr, (AndClause, OrClause)):
+            # NOTE: only the first child is evaluated whenever the clause is evaluated
+            children = [
+                self.generate_condition_source(
+                    child, compilation, unconditional and index == 0
+                )
+                for index, child in enumerate(self.get_logical_clause_children(expr))
+            ]
+            keyword = " and " if isinstance(expr, AndClause) else " or "
+            return f"({keyword.join(children)})"
+
+        else:
+            return f"{bind(self.evaluate_over_record)}({bind(expr)}, r)"
+
+    @classmethod
+    def is_integer_operand(
+        cls, expr: Symbol, is_integer_column: Callable[[str], bool]
+    ) -> bool:
+        """
+        Return True if `expr` is known to evaluate to an integer, i.e. it is an integer literal,
+        a column for which `is_integer_column` is True, or arithmetic over integer operands.
+
+        NOTE: a null operand must not be compared with a python operator, since the comparators
+        fail differently on null operands (see make_comparator)
+        """
+        if isinstance(expr, Expr):
+            return cls.is_integer_operand(expr.expr, is_integer_column)
+        elif isinstance(expr, Literal):
+            # NOTE: bool is a subclass of int; hence check exact type
+            return type(expr.value) is int
+        elif isinstance(expr, ColumnName):
+            return is_integer_column(expr.name)
+        elif isinstance(expr, BinaryArithmeticOperation):
+            return cls.is_integer_operand(
+                expr.operand1, is_integer_column
+            ) and cls.is_integer_operand(expr.operand2, is_integer_column)
+        return False
+
+    @staticmethod
+    def is_non_null_integer_column(schema: Optional[AbstractSchema], name: str) -> bool:
+        """
+        Return True if column `name` of `schema` is a non-nullable integer column.
+        NOTE: only simple schemas are considered, since the records of a scoped schema may be
+        joined with a null record (see join_recordset), i.e. any of their columns can be null
+        """
+        if not isinstance(schema, SimpleSchema):
+            return False
+        column = schema.get_column_by_name(name)
+        return (
+            column is not None and column.datatype is Integer and not column.is_nullable
+        )
+
+    @staticmethod
+    def get_logical_clause_children(clause: Union[AndClause, OrClause]) -> List[Symbol]:
+        """
+        Return children of and/or `clause`
+        """
+        if isinstance(clause, AndClause):
+            return clause.predicates
+        return clause.and_clauses
+
+    # section: constant folding
+
+    def fold_constants(self, expr: Symbol) -> Symbol:
+        """
+        Return `expr` with constant sub-expressions, i.e. comparisons, arithmetic operations,
+        and pure scalar function calls over only literals, replaced by the literal they evaluate to.
+        NOTE: `expr` is not modified; folded nodes are new symbols. Sub-expressions that fail
+        to evaluate, e.g. division by zero, are not folded; so that the failure (if any)
+        happens when the expression is evaluated over records.
+        """
+        if isinstance(expr, Expr):
+            return Expr(expr=self.fold_constants(expr.expr))
+        elif isinstance(expr, OrClause):
+            return OrClause(
+                and_clauses=[self.fold_constants(child) for child in expr.and_clauses]
+            )
+        elif isinstance(expr, AndClause):
+            return AndClause(
+                predicates=[self.fold_constants(child) for child in expr.predicates]
+            )
+        elif isinstance(expr, Comparison):
+            folded = Comparison(
+                left_op=self.fold_constants(expr.left_op),
+                right_op=self.fold_constants(expr.right_op),
+                operator=expr.operator,
+            )
+            operands = [folded.left_op, folded.right_op]
+        elif isinstance(expr, BinaryArithmeticOperation):
+            folded = BinaryArithmeticOperation(
+                operator=expr.operator,
+                operand1=self.fold_constants(expr.operand1),
+                operand2=self.fold_constants(expr.operand2),
+            )
+            operands = [folded.operand1, folded.operand2]
+        elif isinstance(expr, FuncCall) and get_scalar_function(expr.name) is not None:
+            folded = FuncCall(
+                name=expr.name, args=[self.fold_constants(arg) for arg in expr.args]
+            )
+            if not get_scalar_function(expr.name).is_pure:
+                # NOTE: an impure function, e.g. one without args that returns the current time,
+                # must be evaluated per record, even when its args are constant
+                return folded
+            operands = folded.args
+        else:
+            return expr
+
+        if not all(isinstance(operand, Literal) for operand in operands):
+            return folded
+        try:
+            value = self.evaluate_over_record(folded, None)
+        except (ArithmeticError, AssertionError, TypeError, ValueError):
+            return folded
+        symbolic_type = PYTHON_TYPE_TO_SYMBOLIC_DATATYPE.get(type(value))
+        if symbolic_type is None:
+            # e.g. null; can't be represented as literal
+            return folded
+        return Literal(value=value, type=symbolic_type)
+
+    # section: predicate reordering
+
+    def reorder_predicates(
+        self, condition: Symbol, schema: Optional[AbstractSchema]
+    ) -> Symbol:
+        """
+        Return `condition`, over records with `schema`, with the cheap predicates (see is_cheap_predicate)
+        of each and clause moved ahead of the other predicates; so that costlier predicates, e.g. function
+        calls, are only evaluated for records that satisfy the cheap ones.
+
+        NOTE: a predicate may guard the predicates after it, e.g. in `colb != 0 and 10 / colb > 1`,
+        or in `cola > 1 and colb > 1`, where colb is null whenever cola is not greater than 1;
+        hence only predicates that can't fail are moved ahead of earlier predicates, and the other
+        predicates keep their (source) order.
+
+        NOTE: `condition` is not modified. This should only be applied to conditions, i.e. where only
+        the truthiness of the value matters, since the value of an and clause is the value of the first
+        falsey predicate (or of the last predicate).
+        """
+        if isinstance(condition, Expr):
+            return Expr(expr=self.reorder_predicates(condition.expr, schema))
+        elif isinstance(condition, OrClause):
+            return OrClause(
+                and_clauses=[
+                    self.reorder_predicates(child, schema)
+                    for child in condition.and_clauses
+                ]
+            )
+        elif isinstance(condition, AndClause):
+            predicates = [
+                self.reorder_predicates(child, schema) for child in condition.predicates
+            ]
+            cheap = [
+                predicate
+                for predicate in predicates
+                if self.is_cheap_predicate(predicate, schema)
+            ]
+            costly = [
+                predicate
+                for predicate in predicates
+                if not self.is_cheap_predicate(predicate, schema)
+            ]
+            return AndClause(predicates=cheap + costly)
+        return condition
+
+    @classmethod
+    def is_cheap_predicate(
+        cls, predicate: Symbol, schema: Optional[AbstractSchema]
+    ) -> bool:
+        """
+        Return True if `predicate` is cheap to evaluate and can't fail, i.e. it compares two
+        non-null operands, i.e. literals or non-nullable columns, of compatible types: less than etc.
+        comparisons are only defined for numbers (see make_comparator), and otherwise the operands
+        must be numbers, or have the same type.
+        Whereas, e.g. a function call is expensive, arithmetic can fail on division by zero, and
+        a comparison can fail on a null operand
+        """
+        while isinstance(predicate, Expr):
+            predicate = predicate.expr
+        if not isinstance(predicate, Comparison):
+            return False
+        left_type = cls.get_non_null_operand_datatype(predicate.left_op, schema)
+        right_type = cls.get_non_null_operand_datatype(predicate.right_op, schema)
+        if left_type is None or right_type is None:
+            return False
+        if left_type in (Integer, Real) and right_type in (Integer, Real):
+            return True
+        if predicate.operator in (ComparisonOp.Equal, ComparisonOp.NotEqual):
+            return left_type is right_type
+        return False
+
+    @staticmethod
+    def get_non_null_operand_datatype(
+        operand: Symbol, schema: Optional[AbstractSchema]
+    ) -> Optional[Type[DataType]]:
+        """
+        Return datatype of `operand` if it's a literal or a column (of `schema`) that can't be null;
+        otherwise return None.
+        NOTE: only simple schemas are considered; see is_non_null_integer_column
+        """
+        while isinstance(operand, Expr):
+            operand = operand.expr
+        if isinstance(operand, Literal):
+            return PYTHON_TYPE_TO_DATATYPE.get(type(operand.value))
+        if isinstance(operand, ColumnName) and isinstance(schema, SimpleSchema):
+            column = schema.get_column_by_name(operand.name)
+            if column is not None and not column.is_nullable:
+                return column.datatype
+        return None
+
+    # section: operation plans
+
+    def get_operation_plan(
+        self,
+        operation: Symbol,
+        operator_functions: Dict[Any, Callable],
+        left_operand: Symbol,
+        right_operand: Symbol,
+    ) -> Tuple[Symbol, Callable, Callable, Callable]:
+        """
+        Return the plan for a binary `operation`, i.e. a comparison or arithmetic operation.
+        A plan is a tuple of: operation, operator function, and a getter for each operand;
+        a getter takes the record and returns the operand's value.
+
+        NOTE: the operator and the kind of operand only depend on the operation, not the record;
+        hence these are resolved once per operation, rather than for every record, i.e. a column
+        operand reads the record directly, and a literal operand returns its value.
+        The plan holds the operation, so its id is not reused while the plan is cached.
+        """
+        plan = self.operation_plans.get(id(operation))
+        if plan is None:
+            plan = (
+                operation,
+                operator_functions[operation.operator],
+                self.make_operand_getter(left_operand),
+                self.make_operand_getter(right_operand),
+            )
+            self.operation_plans[id(operation)] = plan
+        return plan
+
+    def make_operand_getter(self, operand: Symbol) -> Callable[[Any], Any]:
+        """
+        Return a function that takes a record and returns the value of `operand` over it.
+        NOTE: the kind of operand is determined here, i.e. once per operand, rather than for every record;
+        a parenthesized operand, e.g. `(cola)`, is wrapped in an Expr, and is classified by what it wraps
+        """
+        while isinstance(operand, Expr):
+            operand = operand.expr
+        if isinstance(operand, ColumnName):
+            # NOTE: the name is interned as a plain string; see make_column_getter
+            name = sys.intern(str(operand.name))
+            return lambda record: record.get(name)
+        elif isinstance(operand, Literal):
+            value = operand.value
+            return lambda record: value
+        evaluate = self.evaluate
+        return lambda record: evaluate(operand)
+
+    def get_func_call_plan(
+        self, func_call: FuncCall
+    ) -> Tuple[FuncCall, Callable[[Any], Any]]:
+        """
+        Return the plan for `func_call`. A plan is a tuple of: func_call, and a function that takes
+        the record and evaluates the function call over it.
+
+        NOTE: the function, whether it's an aggregate, and its arity only depend on the func_call,
+        not the record; hence these are resolved once per func_call, and the returned function is
+        specialized for them, i.e. evaluating the call doesn't branch on any of these per record.
+        """
+        plan = self.func_call_plans.get(id(func_call))
+        if plan is None:
+            plan = (func_call, self.make_func_call(func_call))
+            self.func_call_plans[id(func_call)] = plan
+        return plan
+
+    def make_func_call(self, func_call: FuncCall) -> Callable[[Any], Any]:
+        """
+        Return a function that takes a record and evaluates `func_call` over it
+        """
+        func = get_scalar_function(func_call.name)
+        if func is not None:
+            # NOTE: this handles the scalar, no schema, and grouped case, i.e.
+            # scalar function over grouped column.
+            # NOTE: for scalar case the args may be expressions, e.g. square(col_a + 1)
+            # and hence should be evaluated before applying the function
+            apply = func.apply
+            arg_getters = [self.make_operand_getter(arg) for arg in func_call.args]
+            # NOTE: most functions take one or two args; pass these without building a list
+            if len(arg_getters) == 1:
+                (get_arg,) = arg_getters
+                return lambda record: apply((get_arg(record),), NO_NAMED_ARGS)
+            elif len(arg_getters) == 2:
+                get_arg1, get_arg2 = arg_getters
+                return lambda record: apply(
+                    (get_arg1(record), get_arg2(record)), NO_NAMED_ARGS
+                )
+            return lambda record: apply(
+                [get_arg(record) for get_arg in arg_getters], NO_NAMED_ARGS
+            )
+
+        # aggregate function over non-grouped column; here the function should accept
+        # only a single argument, i.e. column name, of non-grouped column.
+        # This is because, semantically, for currently supported aggregate functions, i.e.
+        # min, max, count, etc, it's unclear what multiple arguments could mean, and is hence unsupported.
+        func = get_aggregate_function(func_call.name)
+        # NOTE: this has been confirmed by SemanticAnalyzer
+        assert func is not None
+        apply = func.apply
+        arg_column_name = func_call.args[0].expr.name
+
+        def apply_aggregate(record: GroupedRecord) -> Any:
+            # NOTE: an aggregate function is only valid over a grouped record
+            assert self.mode == EvalMode.Grouped
+            # get list of column values from recordset
+            value_list = record.recordset_to_values(arg_column_name)
+            # wrap value list, since agg function expects a list of pos args, where first arg is value list
+            return apply((value_list,), NO_NAMED_ARGS)
+
+        return apply_aggregate
+
+    def clear_operation_plans(self):
+        """
+        Drop all cached operation (and function call) plans. NOTE: plans reference the symbols; hence
+        this should be called when the statement they belong to is done
+        """
+        self.operation_plans.clear()
+        self.func_call_plans.clear()
+
     # section: other public utils
 
     @staticmethod
@@ -122,106 +1106,60 @@ class ExpressionInterpreter(Visitor):
     def visit_or_clause(self, or_clause: OrClause) -> Union[bool, Any]:
         """
         Evaluate or clause.
-        NOTE: This handles both cases, 1) where the and_clause evaluates to a boolean, and
-        2) to a value. In case 2) it would evaluate the truthyness of the values, and return
-        the last truthy value, if all are truthy or the first falsey value.
+        NOTE: This handles both cases, 1) where the and_clauses evaluate to a boolean, and
+        2) to a value. Evaluation stops at the first truthy value, which is returned; if
+        none are truthy, the last value is returned. For booleans, this is plain or.
+        NOTE: truthiness is python's, e.g. null is falsey, i.e. in a condition, a null value is treated like false
         """
-        or_value = None
-        value_unset = True
+        value = False
+        evaluate = self.evaluate
         for and_clause in or_clause.and_clauses:
-            value = self.evaluate(and_clause)
-            if value_unset:
-                # set value as is
-                or_value = value
-                if isinstance(value, bool) and value is True:
-                    # early exit, entire expression will evaluate to True
-                    return True
-            else:
-                # how to update the value depends on whether it's a bool or non-bool value
-                if isinstance(value, bool):
-                    if value is True:
-                        return True
-                else:
-                    # return first truthy value
-                    breakpoint()
-                    raise NotImplementedError
-
-        return or_value
+            value = evaluate(and_clause)
+            if value:
+                # early exit; remaining clauses can't change the result
+                return value
+        return value
 
     def visit_and_clause(self, and_clause: AndClause) -> Union[bool, Any]:
         """
         Evaluate and clause.
-        NOTE: This handles both cases, 1) where the and_clause evaluates to a boolean, and
-        2) to a value. In case 2) it would evaluate the truthyness of the values, and return
-        the last truthy value, if all are truthy or the first falsey value.
+        NOTE: This handles both cases, 1) where the predicates evaluate to a boolean, and
+        2) to a value. Evaluation stops at the first falsey value, which is returned; if
+        all are truthy, the last value is returned. For booleans, this is plain and.
         """
-        and_value = None
-        # ensure value is set before we begin and'ing
-        value_unset = True
+        value = True
+        evaluate = self.evaluate
         for predicate in and_clause.predicates:
-            value = self.evaluate(predicate)
-            if isinstance(value, bool):
-                # if predicate evaluates to a bool value, we'll track the boolean value of the expression
-                if value is False:
-                    # early exit, entire clause will be True
-                    return False
-                else:
-                    and_value = value
-            else:
-                # non-bool, we'll track values. If all values are truthy, I'll return the last value, else, the
-                # first falsey value - this behaves like coalesce, ifnull utils; similar to python and
-                if value_unset:
-                    # set first value as is
-                    and_value = value
-                    value_unset = False
-                else:
-                    breakpoint()
-                    raise NotImplementedError
-
-        return and_value
+            value = evaluate(predicate)
+            if not value:
+                # early exit; remaining predicates can't change the result
+                return value
+        return value
 
     def visit_comparison(self, comparison: Comparison) -> bool:
         """
         Visit comparison and evaluate to boolean
         """
-        # convert operands to values that can be compared
-        if self.name_registry.is_name(comparison.left_op):
-            resp = self.name_registry.resolve_name(comparison.left_op)
-            assert resp.success
-            left_value = resp.body
-        else:
-            # else evaluate to get value
-            left_value = self.evaluate(comparison.left_op)
-
-        if self.name_registry.is_name(comparison.right_op):
-            resp = self.name_registry.resolve_name(comparison.right_op)
-            assert resp.success
-            right_value = resp.body
-        else:
-            right_value = self.evaluate(comparison.right_op)
-
-        if (
-            comparison.operator != ComparisonOp.Equal
-            and comparison.operator != ComparisonOp.NotEqual
-        ):
-            # equality and inequality can be for any datatypes
-            # less than etc. comparisons are only defined for numeric types
-            assert isinstance(left_value, numbers.Number) and isinstance(
-                right_value, numbers.Number
+        # NOTE: the comparator and the operand getters are resolved once per comparison
+        plan = self.operation_plans.get(id(comparison))
+        if plan is None:
+            plan = self.get_operation_plan(
+                comparison, COMPARATORS, comparison.left_op, comparison.right_op
             )
+        _, comparator, get_left, get_right = plan
+        record = self.record
+        return comparator(get_left(record), get_right(record))
 
-        # NOTE: we handle both integer and real (floating point) numbers
-        # if the two numbers are integers or are more than REAL_EPSILON apart, we can do a strict comparison
-        # however, if they are not so; we must evaluate fuzzy comparison
-        if (
-            isinstance(left_value, float)
-            and abs(left_value - right_value) <= REAL_EPSILON
-        ):
-            return self.evaluate_fuzzy_comparison(
-                comparison, left_value, right_value, REAL_EPSILON
-            )
-        else:
-            return self.evaluate_strict_comparison(comparison, left_value, right_value)
+    @staticmethod
+    def compare(comparison: Comparison, left_value: Any, right_value: Any) -> bool:
+        """
+        Evaluate `comparison` operator on (evaluated) operands `left_value` and `right_value`
+
+        NOTE: we handle both integer and real (floating point) numbers
+        if the two numbers are integers or are more than REAL_EPSILON apart, we can do a strict comparison
+        however, if they are not so; we must evaluate fuzzy comparison. See make_comparator
+        """
+        return COMPARATORS[comparison.operator](left_value, right_value)
 
     @staticmethod
     def evaluate_strict_comparison(
@@ -230,20 +1168,7 @@ class ExpressionInterpreter(Visitor):
         """
         Evaluate strict comparison between `left_value` and `right_value`
         """
-        if comparison.operator == ComparisonOp.Equal:
-            pred_value = left_value == right_value
-        elif comparison.operator == ComparisonOp.NotEqual:
-            pred_value = left_value != right_value
-        elif comparison.operator == ComparisonOp.Greater:
-            pred_value = left_value > right_value
-        elif comparison.operator == ComparisonOp.Less:
-            pred_value = left_value < right_value
-        elif comparison.operator == ComparisonOp.GreaterEqual:
-            pred_value = left_value >= right_value
-        else:
-            assert comparison.operator == ComparisonOp.LessEqual
-            pred_value = left_value <= right_value
-        return pred_value
+        return STRICT_COMPARISON_FUNCTIONS[comparison.operator](left_value, right_value)
 
     @staticmethod
     def evaluate_fuzzy_comparison(
@@ -258,82 +1183,35 @@ class ExpressionInterpreter(Visitor):
         NOTE: This behavior may need to be revisited. For now it provides something
         sensible enough.
         """
-        if comparison.operator == ComparisonOp.Equal:
-            pred_value = abs(left_value - right_value) <= epsilon
-        elif comparison.operator == ComparisonOp.NotEqual:
-            pred_value = abs(left_value - right_value) > epsilon
-        elif comparison.operator == ComparisonOp.Greater:
-            pred_value = left_value + epsilon > right_value
-        elif comparison.operator == ComparisonOp.Less:
-            pred_value = left_value - epsilon < right_value
-        elif comparison.operator == ComparisonOp.GreaterEqual:
-            pred_value = left_value + epsilon >= right_value
-        else:
-            assert comparison.operator == ComparisonOp.LessEqual
-            pred_value = left_value - epsilon <= right_value
-        return pred_value
+        return FUZZY_COMPARISON_FUNCTIONS[comparison.operator](
+            left_value, right_value, epsilon
+        )
 
     def visit_binary_arithmetic_operation(self, operation: BinaryArithmeticOperation):
-        op1_value = self.evaluate(operation.operand1)
-        op2_value = self.evaluate(operation.operand2)
-        if operation.operator == ArithmeticOp.Addition:
-            return op1_value + op2_value
-        elif operation.operator == ArithmeticOp.Subtraction:
-            return op1_value - op2_value
-        elif operation.operator == ArithmeticOp.Multiplication:
-            return op1_value * op2_value
-        else:
-            assert operation.operator == ArithmeticOp.Division
-            if isinstance(op1_value, int):
-                return op1_value // op2_value
-            else:
-                return op1_value / op2_value
+        plan = self.operation_plans.get(id(operation))
+        if plan is None:
+            plan = self.get_operation_plan(
+                operation, ARITHMETIC_FUNCTIONS, operation.operand1, operation.operand2
+            )
+        _, arithmetic_function, get_op1, get_op2 = plan
+        record = self.record
+        return arithmetic_function(get_op1(record), get_op2(record))
 
     def visit_func_call(self, func_call: FuncCall):
         """
         Evaluate
+        NOTE: the function call is specialized once per func_call; see get_func_call_plan
         """
-        if self.mode == EvalMode.Scalar:
-            # get function
-            resp = resolve_scalar_func_name(func_call.name)
-            assert resp.success
-            func = resp.body
-
-            # NOTE: for scalar case the args may be expressions, e.g. square(col_a + 1)
-            # and hence should be evaluated before applying the function
-            evaluated_pos_arg = [self.evaluate(arg) for arg in func_call.args]
-            # NOTE: we currently only support positional args
-            return func.apply(evaluated_pos_arg, {})
-        else:
-            assert self.mode == EvalMode.Grouped
-            # NOTE: for grouped case, we need to handle 2 cases:
-            # case 1) scalar function over grouped column; this is the same as the scalar case
-            resp = resolve_scalar_func_name(func_call.name)
-            if resp.success:
-                func = resp.body
-                evaluated_pos_arg = [self.evaluate(arg) for arg in func_call.args]
-                # NOTE: we currently only support positional args
-                return func.apply(evaluated_pos_arg, {})
-
-            # case 2) aggregate function over non-grouped column; here the function should accept
-            # only a single argument, i.e. column name, of non-grouped column.
-            # This is because, semantically, for currently supported aggregate functions, i.e.
-            # min, max, count, etc, it's unclear what multiple arguments could mean, and is hence unsupported.
-            resp = resolve_aggregate_func_name(func_call.name)
-            assert resp.success  # NOTE: this has been confirmed by SemanticAnalyzer
-            func = resp.body
-            arg_column_name = func_call.args[0].expr.name
-            # get list of column values from recordset
-            value_list = self.record.recordset_to_values(arg_column_name)
-            # wrap value list, since agg function expects a list of pos args, where first arg is value list
-            return func.apply([value_list], {})
+        plan = self.func_call_plans.get(id(func_call))
+        if plan is None:
+            plan = self.get_func_call_plan(func_call)
+        return plan[1](self.record)
 
     def visit_column_name(self, column: ColumnName) -> Any:
-        val = self.record.get(column.name)
-        return val
+        return self.record.get(column.name)
 
     def visit_literal(self, literal: Literal) -> Any:
-        # convert symbolic type to actual type object
-        data_type = datatype_from_symbolic_datatype(literal.type)
-        assert is_term_valid_for_datatype(data_type, literal.value)
+        # NOTE: literals are created with a value of their type, i.e. by the parser or by
+        # constant folding; and the value is validated by the semantic analyzer. Hence,
+        # the value isn't re-validated on every evaluation
         return literal.value
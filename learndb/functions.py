@@ -11,7 +11,18 @@ Functions declarations should apply to both, but only lang functions will have a
 Native functions will have a declaration.
 """
 
-from typing import List, Dict, Any, Callable, Type, TypeVar, Union
+from typing import (
+    List,
+    Dict,
+    Any,
+    Callable,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+)
 
 
 from .dataexchange import Response
@@ -40,6 +51,9 @@ class FunctionDefinition:
     :param named_params:
     :param func_body: callable function body
     :param return_type: return type of function
+    :param is_pure: whether the function's value only depends on its args, i.e. it has no
+        side-effects, and returns the same value for the same args. Only calls to pure functions
+        can be evaluated ahead of time, e.g. when folding constants
     :return:
 
     FUTURE_NOTE: Currently, pos_params are represented as a List[DataType].
@@ -57,12 +71,14 @@ class FunctionDefinition:
         named_params: Dict[str, Type[DataType]],
         func_body: Callable,
         return_type: Type[DataType],
+        is_pure: bool = False,
     ):
         self.name = func_name
         self.pos_params = pos_params
         self.named_params = named_params
         self.body = func_body
         self._return_type = return_type
+        self.is_pure = is_pure
 
     def __str__(self):
         return f"FunctionDefinition[{self.name}]"
@@ -83,7 +99,7 @@ class FunctionDefinition:
         return param.is_valid_term(term)
 
     def validate_args(
-        self, pos_args: List[Any], named_args: Dict[str, Any]
+        self, pos_args: Sequence[Any], named_args: Mapping[str, Any]
     ) -> Response:
         """
         Validate pos and named args.
@@ -109,6 +125,10 @@ class FunctionDefinition:
                 # not sure if this is the best check, since param may be an collection type
                 # but checking for Iterable might catch false positive, which are atom but iterable, e.g. strings
                 for item in param:
+                    if item == DataType:
+                        # NOTE: any value is a valid term; skip checking each value, since
+                        # for aggregate functions, the collection contains a value per record
+                        continue
                     # check each item in the collection
                     for value in arg:
                         if not self.is_valid_term(item, value):
@@ -151,13 +171,13 @@ class FunctionDefinition:
 
         return Response(True)
 
-    def apply(self, pos_args: List[Any], named_args: Dict[str, Any]):
+    def apply(self, pos_args: Sequence[Any], named_args: Mapping[str, Any]):
         """
         This models native functions, where each specific function
         provides a callable `body`.
         For a function in leardb-sql, we will have to walk an AST.
 
-        This accepts a list of `pos_args` and a dict of `named_args`
+        This accepts a sequence of `pos_args` and a mapping of `named_args`; neither is mutated
         This method first evaluates that the args match what is expected by the function definition.
         Then invokes the actual function body/impl
         """
@@ -184,10 +204,10 @@ def number_square_function_body(x: T) -> T:
 
 # square an int
 integer_square_function = FunctionDefinition(
-    "integer_square", [Integer], {}, number_square_function_body, Integer
+    "integer_square", [Integer], {}, number_square_function_body, Integer, is_pure=True
 )
 float_square_function = FunctionDefinition(
-    "float_square", [Real], {}, number_square_function_body, Real
+    "float_square", [Real], {}, number_square_function_body, Real, is_pure=True
 )
 
 
@@ -199,11 +219,8 @@ def value_count_function_body(values: List[Any]) -> int:
     Note: count(*) counts every row (not supported in learndb)
     count(column) should only count non-null columns
     """
-    count = 0
-    for value in values:
-        if value is not None:
-            count += 1
-    return count
+    # NOTE: list.count is evaluated in C
+    return len(values) - values.count(None)
 
 
 # a type of datatype means, it can accept any type
@@ -220,6 +237,20 @@ _SCALAR_FUNCTION_REGISTRY = {
 
 _AGGREGATE_FUNCTION_REGISTRY = {"count": count_function}
 
+# all functions; built once, so that a function name is resolved with a single lookup
+_FUNCTION_REGISTRY = {**_SCALAR_FUNCTION_REGISTRY, **_AGGREGATE_FUNCTION_REGISTRY}
+
+# function name -> successful resolution response; the registries are fixed, hence
+# a name's resolution is built once, rather than on every resolution.
+# NOTE: these responses are shared, and must not be mutated
+_SCALAR_FUNCTION_RESOLUTIONS = {
+    name: Response(True, body=func) for name, func in _SCALAR_FUNCTION_REGISTRY.items()
+}
+_AGGREGATE_FUNCTION_RESOLUTIONS = {
+    name: Response(True, body=func)
+    for name, func in _AGGREGATE_FUNCTION_REGISTRY.items()
+}
+
 
 # public functions
 
@@ -230,11 +261,9 @@ def resolve_function_name(name: str) -> FunctionDefinition:
     In the future this could be extended to support,
     dynamic dispatch, etc.
     """
-    name = name.lower()
-    if name in _SCALAR_FUNCTION_REGISTRY:
-        return _SCALAR_FUNCTION_REGISTRY[name]
-    elif name in _AGGREGATE_FUNCTION_REGISTRY:
-        return _AGGREGATE_FUNCTION_REGISTRY[name]
+    func = _FUNCTION_REGISTRY.get(name.lower())
+    if func is not None:
+        return func
 
     raise ValueError(f"Unable to find function [{name}]")
 
@@ -265,13 +294,32 @@ def is_scalar_function(func_name: str) -> bool:
     return func_name in _SCALAR_FUNCTION_REGISTRY
 
 
+def get_scalar_function(func_name: str) -> Optional[FunctionDefinition]:
+    """
+    Return scalar function with `func_name`, or None if no such function exists.
+    NOTE: unlike resolve_scalar_func_name, this doesn't wrap the result in a Response;
+    hence this is preferred on hot paths, e.g. evaluation
+    """
+    return _SCALAR_FUNCTION_REGISTRY.get(func_name.lower())
+
+
+def get_aggregate_function(func_name: str) -> Optional[FunctionDefinition]:
+    """
+    Return aggregate function with `func_name`, or None if no such function exists
+    """
+    return _AGGREGATE_FUNCTION_REGISTRY.get(func_name.lower())
+
+
 def resolve_scalar_func_name(func_name: str) -> Response:
-    if is_scalar_function(func_name):
-        return Response(True, body=resolve_function_name(func_name))
+    # NOTE: this is called per evaluated function call; hence lookup the prebuilt resolution
+    resolution = _SCALAR_FUNCTION_RESOLUTIONS.get(func_name.lower())
+    if resolution is not None:
+        return resolution
     return Response(False, error_message=f"Scalar function [{func_name}] not found")
 
 
 def resolve_aggregate_func_name(func_name: str) -> Response:
-    if is_aggregate_function(func_name):
-        return Response(True, body=resolve_function_name(func_name))
+    resolution = _AGGREGATE_FUNCTION_RESOLUTIONS.get(func_name.lower())
+    if resolution is not None:
+        return resolution
     return Response(False, error_message=f"Aggregate function [{func_name}] not found")
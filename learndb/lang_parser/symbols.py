@@ -544,7 +544,6 @@ class ToAst(Transformer):
         return SingleSource(name, alias)
 
     def joining(self, args):
-        breakpoint()
         raise NotImplementedError
 
     def conditioned_join(self, args):
@@ -676,8 +675,7 @@ class ToAst(Transformer):
         if len(args) == 1:
             return args[0]
         else:
-            breakpoint()
-            raise ValueError()
+            raise ValueError(f"Expected a single literal; received {args}")
 
     # func calls - right now only used in select
     def func_name(self, args):
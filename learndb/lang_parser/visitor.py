@@ -1,5 +1,6 @@
 from __future__ import annotations
 import logging
+from typing import Callable, Dict, Tuple
 from .utils import camel_to_snake
 
 
@@ -12,6 +13,10 @@ class HandlerNotFoundException(Exception):
     pass
 
 
+# (visitor class, symbol class) -> handler
+handler_cache: Dict[Tuple[type, type], Callable] = {}
+
+
 class Visitor:
     """
     Conceptually, Visitor is an interface/abstract class,
@@ -26,19 +31,50 @@ class Visitor:
      https://refactoring.guru/design-patterns/visitor/python/example
     """
 
+    # NOTE: empty slots, so that concrete visitors can define their own slots
+    __slots__ = ()
+
     def visit(self, symbol: "Symbol"):  # noqa F821
         """
         this will determine which specific handler to invoke; dispatch
+        NOTE: the handler is resolved once per (visitor class, symbol class) and cached;
+        since dispatch happens for every node, for every record
+        """
+        handler = handler_cache.get((self.__class__, symbol.__class__))
+        if handler is None:
+            handler = self.resolve_handler(symbol.__class__)
+        return handler(self, symbol)
+
+    def resolve_handler(self, symbol_class: type) -> Callable:
         """
-        suffix = camel_to_snake(symbol.__class__.__name__)
+        Determine the handler (an unbound method) for `symbol_class`, and cache it
+        """
+        suffix = camel_to_snake(symbol_class.__name__)
         # determine the name of the handler method from class of expr
         # NB: this requires the class and handler have the
         # same name in PascalCase and snake_case, respectively
-        handler = f"visit_{suffix}"
-        if hasattr(self, handler):
-            return getattr(self, handler)(symbol)
-        else:
-            logging.warning(f"Visitor does not have {handler}")
+        handler_name = f"visit_{suffix}"
+        handler = getattr(self.__class__, handler_name, None)
+        if handler is None:
+            logging.warning(f"Visitor does not have {handler_name}")
             raise HandlerNotFoundException(
-                f"Visitor [{self.__class__.__name__}] does not have {handler}"
+                f"Visitor [{self.__class__.__name__}] does not have {handler_name}"
             )
+        handler_cache[(self.__class__, symbol_class)] = handler
+        return handler
+
+    def bind_handler(
+        self, symbol_class: type, dispatch: Dict[type, Callable]
+    ) -> Callable:
+        """
+        Determine the handler for `symbol_class`, bound to this visitor, and add it
+        to `dispatch`, i.e. a per-visitor table of symbol class -> bound handler.
+        NOTE: hot visitors can dispatch via such a table, i.e. `dispatch[type(symbol)](symbol)`,
+        which avoids the call to `visit` and the (visitor class, symbol class) key per node
+        """
+        handler = handler_cache.get((self.__class__, symbol_class))
+        if handler is None:
+            handler = self.resolve_handler(symbol_class)
+        bound_handler = handler.__get__(self, self.__class__)
+        dispatch[symbol_class] = bound_handler
+        return bound_handler
@@ -1,66 +1,41 @@
-import logging
-
-from lark import Token
+from typing import Optional, Type
 
 from .dataexchange import Response
-from .lang_parser.symbols import ColumnName
-from .record_utils import InvalidNameException
+from .datatypes import DataType
 
 
 class NameRegistry:
     """
     This entity is responsible for registering and resolving column name and types
-    from records and schemas.
-    TODO: split this into SchemaReader, and RecordReader
+    from schemas.
+    NOTE: names are resolved to values, i.e. over records, by the ExpressionInterpreter;
+    which holds the record being evaluated over
     """
 
+    __slots__ = ("schema",)
+
     def __init__(self):
-        # record used to resolve values
-        self.record = None
         # schema to resolve names from
         self.schema = None
 
-    def set_record(self, record):
-        self.record = record
-
     def set_schema(self, schema):
         self.schema = schema
 
-    def is_name(self, operand) -> bool:
+    def get_column_name_type(self, operand: str) -> Optional[Type[DataType]]:
         """
-        Return true if operand is a name, i.e. IDENTIFIER or SCOPED_IDENTIFIER
+        Determine type of column name; None if the column doesn't exist.
+        NOTE: unlike resolve_column_name_type, this doesn't wrap the result in a Response
         """
-        if isinstance(operand, Token) and (
-            operand.type == "IDENTIFIER" or operand.type == "SCOPED_IDENTIFIER"
-        ):
-            return True
-        elif isinstance(operand, ColumnName):
-            return True
-        else:
-            return False
-
-    def resolve_name(self, operand) -> Response:
-        """
-        This is only valid if called on a name, i.e. is_name(operand) == True.
-        Note: This returns Response to distinguish resolve failed, from resolved to None
-        """
-        if isinstance(operand, ColumnName):
-            try:
-                val = self.record.get(operand.name)
-                return Response(True, body=val)
-            except InvalidNameException as e:
-                logging.error(f"Attempted lookup on unknown column [{operand.name}]")
-                logging.error(f"Valid column choices are [{self.record.columns}]")
-                return Response(False, error_message=e.args[0])
-
-        # NOTE: this was adapated from vm.check_resolve_name
-        raise NotImplementedError
+        column = self.schema.get_column_by_name(operand)
+        if column is not None:
+            return column.datatype
+        return None
 
     def resolve_column_name_type(self, operand: str) -> Response:
         """
         Determine type of column name
         """
-        if self.schema.has_column(operand):
-            column = self.schema.get_column_by_name(operand)
-            return Response(True, body=column.datatype)
+        datatype = self.get_column_name_type(operand)
+        if datatype is not None:
+            return Response(True, body=datatype)
         return Response(False, error_message=f"Unable to resolve column [{operand}]")
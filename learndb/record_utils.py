@@ -5,7 +5,8 @@ Contains definitions and utilities to create and modifies Records.
 Records are data containing objects that conform to a schema.
 # TODO: should this module be called `record.py`
 """
-from typing import Any, List, Optional, Union, Tuple
+import sys
+from typing import Any, Callable, List, Optional, Union, Tuple
 
 from .dataexchange import Response
 from .lang_parser.symbols import ColumnName, ColumnNameList, ValueList, Literal
@@ -29,8 +30,13 @@ class AbstractRecord:
     Interface for Record.
     NOTE: this doesn't enforce that implementation classes implement all interface methods.
     TODO: Consider formalizing the interface using abc.ABCMeta; see: https://realpython.com/python-interface/
+
+    NOTE: records are created in large numbers, hence record classes declare their
+    attributes via __slots__, i.e. instances have a fixed layout, and no per-instance __dict__
     """
 
+    __slots__ = ()
+
     def get(self, column: str):
         raise NotImplementedError
 
@@ -46,6 +52,8 @@ class SimpleRecord(AbstractRecord):
     # if the returned pipe allows
     """
 
+    __slots__ = ("values", "schema")
+
     def __init__(self, values: dict = None, schema: SimpleSchema = None):
         # unordered mapping from: column-name -> column-value
         self.values = values
@@ -73,10 +81,16 @@ class SimpleRecord(AbstractRecord):
         """
         column names are internally represented as lowercase versions
         of their names; thus the column must be lowercased for the lookup
+        NOTE: this is called per column reference, per record; and names are usually
+        already lowercase; hence the name is first looked up as is, which avoids
+        allocating (and hashing) a lowercased copy of the name
         :param column:
         :return:
         """
-        return self.values[column.lower()]
+        values = self.values
+        if column in values:
+            return values[column]
+        return values[column.lower()]
 
     def at_index(self, pos: int):
         """
@@ -113,6 +127,8 @@ class ScopedRecord(AbstractRecord):
     # TODO: this should handle init records as two simple records, or a simple and JoinedRecord
     # for a joinedRecord, it should determine be able to flatten and store it
     # think through how this will generalize
+    __slots__ = ("names", "schema")
+
     def __init__(self, name_to_records: dict, schema: ScopedSchema):
         self.names = name_to_records
         self.schema = schema
@@ -206,6 +222,60 @@ class ScopedRecord(AbstractRecord):
         return f"JRecord[{self.names}]"
 
 
+class JoinedRecordView(AbstractRecord):
+    """
+    A view over a (left, right) pair of records being joined. This exposes the
+    same `get` as the ScopedRecord that would be created from the pair, i.e. via ScopedRecord.from_records,
+    without creating it.
+
+    NOTE: This is used to evaluate the join condition over candidate pairs; only pairs that
+    match are materialized into a ScopedRecord. The view is mutable, i.e. a single view
+    is reused for all candidate pairs, via `set_records`.
+    """
+
+    __slots__ = ("left_alias", "right_alias", "left_rec", "right_rec")
+
+    def __init__(self, left_alias: Optional[str], right_alias: str):
+        self.left_alias = left_alias
+        self.right_alias = right_alias
+        self.left_rec = None
+        self.right_rec = None
+
+    def set_records(
+        self, left_rec: Union[SimpleRecord, ScopedRecord], right_rec: SimpleRecord
+    ):
+        self.left_rec = left_rec
+        self.right_rec = right_rec
+
+    def get(self, fqname):
+        """
+        Given a fq column name, e.g. f.cola
+        """
+        parts = fqname.split(".")
+        if len(parts) != 2:
+            raise InvalidNameException(
+                f"Expected 2 part name formatted like <table-alias>.<column-name>; received {fqname}"
+            )
+        table, column = parts
+        if table == self.right_alias:
+            record = self.right_rec
+        elif isinstance(self.left_rec, ScopedRecord):
+            return self.left_rec.get(fqname)
+        elif table == self.left_alias:
+            record = self.left_rec
+        else:
+            raise ValueError(f"Unknown table alias [{table}]")
+
+        if isinstance(record, SimpleRecord):
+            return record.get(column)
+        else:
+            assert isinstance(record, ScopedRecord)
+            return record.get(fqname)
+
+    def __repr__(self):
+        return f"JRecView[{self.left_rec}, {self.right_rec}]"
+
+
 class GroupedRecord(AbstractRecord):
     """
     Provides encapsulation over a record group.
@@ -216,6 +286,8 @@ class GroupedRecord(AbstractRecord):
     suffix since it implements the Record interface.
     """
 
+    __slots__ = ("schema", "group_key", "group_recordset", "column_values")
+
     def __init__(
         self,
         schema: GroupedSchema,
@@ -226,6 +298,8 @@ class GroupedRecord(AbstractRecord):
         self.schema = schema
         self.group_key = group_key
         self.group_recordset = group_recordset
+        # column name -> list of column values from group_recordset
+        self.column_values = {}
 
     def has_columns(self, column: str) -> bool:
         # TODO: nuke; unused
@@ -251,8 +325,15 @@ class GroupedRecord(AbstractRecord):
     def recordset_to_values(self, column_name: str) -> List[Any]:
         """
         Generate list of column values from group_recordset.
+        NOTE: the list is generated once per column, and cached; since multiple aggregates, e.g.
+        min(cola), max(cola), may be evaluated over the same column of a group. Hence the returned
+        list must not be mutated
         """
-        return [record.get(column_name) for record in self.group_recordset]
+        values = self.column_values.get(column_name)
+        if values is None:
+            values = [record.get(column_name) for record in self.group_recordset]
+            self.column_values[column_name] = values
+        return values
 
     def get_group_recordset(self) -> List[Union[SimpleRecord, ScopedRecord]]:
         """
@@ -290,6 +371,36 @@ def join_records(
     return joined
 
 
+def make_column_getter(
+    schema: Union[SimpleSchema, ScopedSchema, None], name: str
+) -> Callable[[Union[SimpleRecord, ScopedRecord]], Any]:
+    """
+    Return a function that gets the value of column `name` from a record with `schema`.
+    This is equivalent to record.get(name); however, the name is resolved against
+    the schema once, rather than on every get.
+
+    NOTE: keys are interned plain strings; record values are keyed by the (interned) column names,
+    and hence the lookup is an identity comparison. Whereas `name` is typically a (lark) Token,
+    i.e. a str subclass, which as a dict key is much slower to lookup
+    """
+    if isinstance(schema, SimpleSchema):
+        # simple records are keyed by lowercased column name
+        key = sys.intern(name.lower())
+        return lambda record: record.values[key]
+
+    parts = name.split(".")
+    if (
+        isinstance(schema, ScopedSchema)
+        and len(parts) == 2
+        and isinstance(schema.schemas.get(parts[0]), SimpleSchema)
+    ):
+        alias, key = sys.intern(parts[0]), sys.intern(parts[1].lower())
+        return lambda record: record.names[alias].values[key]
+
+    # NOTE: any other case, e.g. nested scoped records, is resolved by the record
+    return lambda record: record.get(name)
+
+
 def create_null_record(schema: SimpleSchema) -> SimpleRecord:
     """
     given a `schema` return a record with the given
@@ -11,8 +11,9 @@ While, records- i.e. data-containing objects with the structure
 specified by the schema-, and related utilities are contained in record_utils.py
 """
 
+import sys
 from copy import copy
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from .datatypes import DataType, Integer, Text, Blob, Real
 from .dataexchange import Response
@@ -31,7 +32,9 @@ class Column:
         is_primary_key: bool = False,
         is_nullable: bool = True,
     ):
-        self.name = name.lower()
+        # NOTE: the name is interned, since it keys the values of every record with this column;
+        # see make_column_getter
+        self.name = sys.intern(name.lower())
         self.datatype = datatype
         self.is_primary_key = is_primary_key
         self.is_nullable = is_nullable
@@ -83,6 +86,8 @@ class SimpleSchema(AbstractSchema):
         self.name = name
         # list of column objects ordered by definition order
         self.cols = columns
+        # column name -> column object; built on first lookup
+        self.column_index = None
 
     @property
     def columns(self):
@@ -106,11 +111,9 @@ class SimpleSchema(AbstractSchema):
         return None
 
     def get_column_by_name(self, name) -> Optional[Column]:
-        name = name.lower()
-        for column in self.columns:
-            if column.name.lower() == name:
-                return column
-        return None
+        if self.column_index is None:
+            self.column_index = build_column_index(self.columns)
+        return self.column_index.get(name.lower())
 
     def has_column(self, name: str) -> bool:
         """
@@ -168,6 +171,9 @@ class ScopedSchema(AbstractSchema):
         assert len(name_parts) == 2
         table_alias, column_name = name_parts
         table_schema = self.schemas[table_alias]
+        if isinstance(table_schema, SimpleSchema):
+            return table_schema.get_column_by_name(column_name)
+        # NOTE: an aliased source can itself have a scoped schema
         for column in table_schema.columns:
             if column.name.lower() == column_name:
                 return column
@@ -188,9 +194,18 @@ class GroupedSchema(AbstractSchema):
         self.schema = schema
         # list of group-by columns, sorted by grouping order
         self.group_by_columns = group_by_columns
+        # columns, and column name -> column object; built on first access
+        self.cols = None
+        self.column_index = None
 
     @property
     def columns(self) -> List[Column]:
+        # NOTE: the schema is read-only once constructed; hence the columns are only generated once
+        if self.cols is None:
+            self.cols = self.generate_columns()
+        return self.cols
+
+    def generate_columns(self) -> List[Column]:
         if isinstance(self.schema, SimpleSchema):
             return self.schema.columns
         else:
@@ -208,14 +223,11 @@ class GroupedSchema(AbstractSchema):
             return columns
 
     def get_column_by_name(self, name) -> Optional[Column]:
-        name = name.lower()
-        for column in self.columns:
-            if column.name.lower() == name:
-                return column
-        return None
+        if self.column_index is None:
+            self.column_index = build_column_index(self.columns)
+        return self.column_index.get(name.lower())
 
     def has_column(self, name) -> bool:
-        # todo: consider caching this
         column = self.get_column_by_name(name)
         return column is not None
 
@@ -235,6 +247,18 @@ class GroupedSchema(AbstractSchema):
 NonGroupedSchema = Union[SimpleSchema, ScopedSchema]
 
 
+def build_column_index(columns: List[Column]) -> Dict[str, Column]:
+    """
+    Build index of (lower-cased) column name -> column, so a column
+    can be looked up by name without scanning the columns.
+    NOTE: if names are duplicated, the first column with the name is indexed
+    """
+    index = {}
+    for column in columns:
+        index.setdefault(column.name.lower(), column)
+    return index
+
+
 class CatalogSchema(SimpleSchema):
     """
     Hardcoded schema object for the catalog table.
@@ -342,20 +366,24 @@ def validate_schema(schema: SimpleSchema) -> Response:
     return Response(True)
 
 
+# symbolic datatype -> datatype, for datatypes a column can have
+COLUMN_DATATYPES = {
+    SymbolicDataType.Integer: Integer,
+    SymbolicDataType.Text: Text,
+    SymbolicDataType.Blob: Blob,
+    SymbolicDataType.Real: Real,
+}
+
+
 def token_to_datatype(datatype: DataType) -> Response:
     """
     parse datatype token into DataType
     :param datatype_token:
     :return:
     """
-    if datatype == SymbolicDataType.Integer:
-        return Response(True, body=Integer)
-    elif datatype == SymbolicDataType.Text:
-        return Response(True, body=Text)
-    elif datatype == SymbolicDataType.Blob:
-        return Response(True, body=Blob)
-    elif datatype == SymbolicDataType.Real:
-        return Response(True, body=Real)
+    column_datatype = COLUMN_DATATYPES.get(datatype)
+    if column_datatype is not None:
+        return Response(True, body=column_datatype)
     return Response(False, error_message=f"Unrecognized datatype: [{datatype}]")
 
 
@@ -1,14 +1,15 @@
 from enum import Enum, auto
-from typing import Optional, Type
+from typing import List, Optional, Type
 
 from .dataexchange import Response
-from .datatypes import DataType
+from .datatypes import Boolean, DataType, Integer, Real, is_term_valid_for_datatype
 from .functions import resolve_scalar_func_name, resolve_aggregate_func_name
 from .lang_parser.symbols import (
     Symbol,
     Expr,
     OrClause,
     AndClause,
+    Comparison,
     BinaryArithmeticOperation,
     FuncCall,
     ColumnName,
@@ -31,6 +32,21 @@ class SemanticAnalysisFailure(Enum):
     FunctionMismatch = auto()
 
 
+# datatypes that can be compared with each other
+NUMERIC_DATATYPES = (Integer, Real)
+
+# symbol classes whose handlers are bound when the analyzer is created
+EXPRESSION_SYMBOL_CLASSES = (
+    OrClause,
+    AndClause,
+    Comparison,
+    BinaryArithmeticOperation,
+    FuncCall,
+    ColumnName,
+    Literal,
+)
+
+
 class SemanticAnalyzer(Visitor):
     """
     Performs semantic analysis:
@@ -44,6 +60,15 @@ class SemanticAnalyzer(Visitor):
 
     """
 
+    __slots__ = (
+        "name_registry",
+        "mode",
+        "failure_type",
+        "error_message",
+        "schema",
+        "dispatch",
+    )
+
     def __init__(self, name_registry: NameRegistry):
         self.name_registry = name_registry
         self.mode = None
@@ -51,6 +76,10 @@ class SemanticAnalyzer(Visitor):
         self.error_message = ""
         # schema used to check column existence, etc.
         self.schema = None
+        # symbol class -> bound handler
+        self.dispatch = {}
+        for symbol_class in EXPRESSION_SYMBOL_CLASSES:
+            self.bind_handler(symbol_class, self.dispatch)
 
     def analyze_no_schema(self, expr):
         """
@@ -94,44 +123,68 @@ class SemanticAnalyzer(Visitor):
             )
 
     def evaluate(self, expr: Symbol) -> Type[DataType]:
-        return_value = expr.accept(self)
-        return return_value
+        # NOTE: dispatch directly via the bound handler table, rather than via expr.accept or visit
+        handler = self.dispatch.get(expr.__class__)
+        if handler is None:
+            handler = self.bind_handler(expr.__class__, self.dispatch)
+        return handler(expr)
 
     def visit_expr(self, expr: Expr):
         return self.evaluate(expr.expr)
 
     def visit_or_clause(self, or_clause: OrClause):
-        or_value = None
-        value_unset = True
-        for and_clause in or_clause.and_clauses:
-            value = self.evaluate(and_clause)
-            if value_unset:
-                or_value = value
-                value_unset = False
-            else:
-                # NOTE: and clause can only be applied over booleans (true, false, null), else error
-                raise NotImplementedError
-        return or_value
+        """
+        NOTE: evaluation of an or clause short-circuits; but analysis must still
+        check every and_clause, since any of them can be evaluated. Analysis
+        bails at the first failing and_clause.
+        """
+        return self.analyze_logical_clause(or_clause.and_clauses)
 
     def visit_and_clause(self, and_clause: AndClause):
         """
         NOTE: This handles both where the and_clause is evals to a bool, and
         to an value
         """
-        and_value = None
-        # ensure value is set before we begin and'ing
-        value_unset = True
-        for predicate in and_clause.predicates:
-            pred_val = self.evaluate(predicate)
-            if value_unset:
-                # set first value as is
-                and_value = pred_val
-                value_unset = False
-            else:
-                # NOTE: and clause can only be applied over booleans (true, false, null), else error
-                raise NotImplementedError
-
-        return and_value
+        return self.analyze_logical_clause(and_clause.predicates)
+
+    def analyze_logical_clause(self, children: List[Symbol]) -> Type[DataType]:
+        """
+        Analyze children of an and/or clause, and return the type of the clause.
+        NOTE: the clause evaluates to one of the children's values; hence (with strict
+        type checking) all children must have the same type
+        """
+        clause_type = None
+        for child in children:
+            child_type = self.evaluate(child)
+            if clause_type is None:
+                clause_type = child_type
+            elif child_type != clause_type:
+                self.failure_type = SemanticAnalysisFailure.TypeMismatch
+                self.error_message = (
+                    f"Type mismatch; {child} is of type {child_type}; "
+                    f"expected type {clause_type}"
+                )
+                raise SemanticAnalysisError()
+        return clause_type
+
+    def visit_comparison(self, comparison: Comparison) -> Type[DataType]:
+        """
+        A comparison evaluates to a boolean. NOTE: numbers, i.e. integers and reals,
+        can be compared with each other (see ExpressionInterpreter.compare); otherwise
+        the operands must have the same type
+        """
+        left_type = self.evaluate(comparison.left_op)
+        right_type = self.evaluate(comparison.right_op)
+        if left_type != right_type and not (
+            left_type in NUMERIC_DATATYPES and right_type in NUMERIC_DATATYPES
+        ):
+            self.failure_type = SemanticAnalysisFailure.TypeMismatch
+            self.error_message = (
+                f"Type mismatch; {comparison.left_op} is of type {left_type}; "
+                f"{comparison.right_op} is of type {right_type}"
+            )
+            raise SemanticAnalysisError()
+        return Boolean
 
     def visit_binary_arithmetic_operation(self, operation: BinaryArithmeticOperation):
         # evaluate operators, then check type
@@ -256,13 +309,21 @@ class SemanticAnalyzer(Visitor):
             self.failure_type = SemanticAnalysisFailure.ColumnDoesNotExist
             raise SemanticAnalysisError()
 
-        resp = self.name_registry.resolve_column_name_type(column_name.name)
-        if resp.success:
-            return resp.body
+        datatype = self.name_registry.get_column_name_type(column_name.name)
+        if datatype is not None:
+            return datatype
         # name registry was unable to resolve name
-        self.error_message = f"Name registry failed to resolve column [{column_name}] due to: [{resp.error_message}]"
+        self.error_message = f"Name registry failed to resolve column [{column_name}] due to: [Unable to resolve column [{column_name.name}]]"
         self.failure_type = SemanticAnalysisFailure.ColumnDoesNotExist
         raise SemanticAnalysisError()
 
     def visit_literal(self, literal: Literal) -> Type[DataType]:
-        return datatype_from_symbolic_datatype(literal.type)
+        # convert symbolic type to actual type object
+        data_type = datatype_from_symbolic_datatype(literal.type)
+        if not is_term_valid_for_datatype(data_type, literal.value):
+            self.failure_type = SemanticAnalysisFailure.TypeMismatch
+            self.error_message = (
+                f"Literal value [{literal.value}] is not valid for type {data_type}"
+            )
+            raise SemanticAnalysisError()
+        return data_type
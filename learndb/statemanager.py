@@ -3,16 +3,14 @@ class representing a logical-database
 support API to read/write data via Table
 and creating tables etc.
 """
-import random
-import string
-from collections import UserList, UserDict
-from typing import Optional, List, Union, Tuple
+from collections import UserList
+from typing import Iterable, Optional, List, Union, Tuple
 
 from .btree import Tree
 from .constants import CATALOG_ROOT_PAGE_NUM
 from .dataexchange import Response
 from .pager import Pager
-from .record_utils import GroupedRecord
+from .record_utils import GroupedRecord, make_column_getter
 from .schema import (
     SimpleSchema,
     ScopedSchema,
@@ -24,27 +22,45 @@ from .schema import (
 
 class RecordSet(UserList):
     """
-    Maintains a list of records
+    Maintains a list of records.
+
+    NOTE: records are stored row-wise, since records are passed as is to downstream
+    operators and the output pipe. However, column-at-a-time consumers can access
+    a column, i.e. list of values of a column across all records, via `column`. Columns
+    are materialized on first access and cached.
     """
 
-    pass
+    def __init__(self, initlist=None, schema: Optional[NonGroupedSchema] = None):
+        super().__init__(initlist)
+        # schema of records; used to resolve column names once per column
+        self.schema = schema
+        # column name -> list of values
+        self.column_cache = {}
+
+    def column(self, name: str) -> List:
+        """
+        Return list of values of column `name`, ordered like the records.
+        NOTE: recordsets are append-only; hence a cached column is only stale
+        when records have been appended, and only needs to be extended
+        """
+        values = self.column_cache.get(name)
+        if values is None:
+            values = list(map(make_column_getter(self.schema, name), self.data))
+            self.column_cache[name] = values
+        elif len(values) < len(self.data):
+            values.extend(
+                map(make_column_getter(self.schema, name), self.data[len(values) :])
+            )
+        return values
 
 
-class GroupedRecordSet(UserDict):
+class GroupedRecordSet(dict):
     """
     Maintains a dictionary of lists of records, where the dict is
-    indexed by the group key
-    """
-
-    def __getitem__(self, key):
-        if key not in self.data:
-            self.data[key] = []
-        return self.data[key]
+    indexed by the group key.
 
-    def __setitem__(self, key, value):
-        if key not in self.data:
-            self.data[key] = []
-        self.data[key].append(value)
+    NOTE: this is a plain dict, i.e. groups must be explicitly created, e.g. via setdefault
+    """
 
 
 class Scope:
@@ -147,6 +163,9 @@ class StateManager:
         self.trees = {}
         # scope stack
         self.scopes: List[Scope] = []
+        # counters to generate unique recordset names
+        self.recordset_counter = 0
+        self.grouped_recordset_counter = 0
 
     def close(self):
         """
@@ -220,43 +239,21 @@ class StateManager:
 
     # recordset management
 
-    @staticmethod
-    def gen_randkey(size=10, prefix=""):
-        return prefix + "".join(
-            random.choice(string.ascii_letters) for i in range(size)
-        )
-
     def unique_recordset_name(self) -> str:
         """
         Generate a recordset name unique across all scopes
+        NOTE: names are generated from a counter, that is never reset; hence
+        a name is unique across all scopes, for the lifetime of the state manager
         """
-        is_unique = False
-        name = None
-        while not is_unique:
-            name = self.gen_randkey(prefix="r")
-            # name must be unique across all scopes
-            for scope in self.scopes:
-                if scope.get_recordset(name) is not None:
-                    break
-            else:
-                is_unique = True
-        return name
+        self.recordset_counter += 1
+        return f"r{self.recordset_counter}"
 
     def unique_grouped_recordset_name(self) -> str:
         """
-        Generate a recordset name unique across all scopes
+        Generate a grouped recordset name unique across all scopes
         """
-        is_unique = False
-        name = None
-        while not is_unique:
-            name = self.gen_randkey(prefix="g")
-            # name must be unique across all scopes
-            for scope in self.scopes:
-                if scope.get_grouped_recordset(name) is not None:
-                    break
-            else:
-                is_unique = True
-        return name
+        self.grouped_recordset_counter += 1
+        return f"g{self.grouped_recordset_counter}"
 
     def init_recordset(self, schema: Union[SimpleSchema, ScopedSchema]) -> Response:
         """
@@ -266,7 +263,7 @@ class StateManager:
         """
         name = self.unique_recordset_name()
         scope = self.scopes[-1]
-        scope.add_recordset(name, schema, RecordSet())
+        scope.add_recordset(name, schema, RecordSet(schema=schema))
         return Response(True, body=name)
 
     def init_grouped_recordset(self, schema: GroupedSchema):
@@ -318,6 +315,16 @@ class StateManager:
         recordset = scope.get_recordset(name)
         recordset.append(record)
 
+    def extend_recordset(self, name: str, records: Iterable):
+        """
+        find the correct recordset across all scopes;
+        then add all `records` to it
+        """
+        scope = self.find_recordset_scope(name)
+        assert scope is not None
+        recordset = scope.get_recordset(name)
+        recordset.extend(records)
+
     def append_grouped_recordset(self, name: str, group_key: Tuple, record):
         """
         Add record to a group
@@ -325,7 +332,7 @@ class StateManager:
         scope = self.find_grouped_recordset_scope(name)
         assert scope is not None
         recordset = scope.get_grouped_recordset(name)
-        recordset[group_key].append(record)
+        recordset.setdefault(group_key, []).append(record)
 
     def add_group_grouped_recordset(self, name: str, group_key: Tuple, group_recordset):
         """
@@ -345,6 +352,24 @@ class StateManager:
     def drop_grouped_recordset(self, name: str):
         raise NotImplementedError
 
+    def get_recordset(self, name: str) -> RecordSet:
+        """
+        Return recordset with `name`.
+        NOTE: the recordset is not a copy, and must not be mutated by the caller
+        """
+        scope = self.find_recordset_scope(name)
+        assert scope is not None
+        return scope.get_recordset(name)
+
+    def get_grouped_recordset(self, name: str) -> GroupedRecordSet:
+        """
+        Return grouped recordset with `name`.
+        NOTE: the recordset is not a copy
+        """
+        scope = self.find_grouped_recordset_scope(name)
+        assert scope is not None
+        return scope.get_grouped_recordset(name)
+
     def recordset_iter(self, name: str):
         """Return an iterator over recordset
         NOTE: The iterator will be consumed after one iteration
@@ -11,6 +11,7 @@ from typing import Any, Dict, List, NewType, Union
 from .functions import FunctionDefinition
 from .lang_parser.symbols import OrClause
 from .record_utils import SimpleRecord, ScopedRecord, GroupedRecord
+from .schema import SimpleSchema, ScopedSchema
 from .expression_interpreter import ExpressionInterpreter
 
 
@@ -75,13 +76,15 @@ class ValueGeneratorFromRecordOverFunc:
         """
         # evaluate pos_args, i.e. convert SelectableAtom to a value that can be passed to a function
         evaluated_pos_args = []
+        append_arg = evaluated_pos_args.append
+        get_value = record.get
         for arg in self.pos_args:
             if isinstance(arg, LiteralSelectableAtom):
                 # evaluate any literals, by unboxing from `LiteralSelectableAtom`
-                evaluated_pos_args.append(arg.value)
+                append_arg(arg.value)
             else:
                 # evaluate any column references, i.e. replace with value in record
-                evaluated_pos_args.append(record.get(arg.name))
+                append_arg(get_value(arg.name))
 
         evaluated_named_args = {}
         for arg_name, arg_val in self.named_args.items():
@@ -103,16 +106,26 @@ class ValueGeneratorFromRecordOverExpr:
     This generalizes the ValueGeneratorFromRecordOverFunc, ValueExtractorFromRecord
     """
 
-    def __init__(self, or_clause: OrClause, interpreter: ExpressionInterpreter):
+    def __init__(
+        self,
+        or_clause: OrClause,
+        interpreter: ExpressionInterpreter,
+        schema: Union[SimpleSchema, ScopedSchema],
+    ):
         self.or_clause = or_clause
         self.interpreter = interpreter
+        # NOTE: get_value is called per record; hence compile the expr once, rather
+        # than interpreting the expr tree for each record. The expr is specialized for
+        # the records' `schema`, i.e. column references are resolved once
+        self.evaluate = interpreter.compile_condition(
+            interpreter.fold_constants(or_clause), schema
+        )
 
     def get_value(self, record: Union[SimpleRecord, ScopedRecord]) -> Any:
         """
         Evaluate the or_clause
         """
-        value = self.interpreter.evaluate_over_record(self.or_clause, record)
-        return value
+        return self.evaluate(record)
 
 
 class ValueGeneratorFromNoRecordOverExpr:
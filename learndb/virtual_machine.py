@@ -5,16 +5,20 @@ Executes the AST generated by the parser.
 import logging
 
 
-from typing import Any, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+from collections import OrderedDict
 from collections.abc import Iterable
 from enum import Enum, auto
 from dataclasses import dataclass
+from itertools import compress, islice, product
+from operator import itemgetter
 
 
 from .btree import Tree, TreeInsertResult, TreeDeleteResult
-from .constants import CATALOG
+from .constants import CATALOG, DERIVED_SCHEMA_CACHE_SIZE, SORT_MERGE_JOIN_THRESHOLD
 from .cursor import Cursor
 from .dataexchange import Response
+from .datatypes import DataType, Real
 from .functions import resolve_function_name
 from .lang_parser.visitor import Visitor
 from .lang_parser.symbols import (
@@ -32,6 +36,9 @@ from .lang_parser.symbols import (
     ColumnName,
     Literal,
     Expr,
+    Comparison,
+    ComparisonOp,
+    AndClause,
     InsertStmnt,
     DropStmnt,
     OrderByClause,
@@ -44,11 +51,12 @@ from .record_utils import (
     GroupedRecord,
     create_catalog_record,
     ScopedRecord,
+    JoinedRecordView,
     create_record,
     create_null_record,
     create_record_from_raw_values,
 )
-from .statemanager import StateManager
+from .statemanager import StateManager, RecordSet, GroupedRecordSet
 from .schema import (
     generate_schema,
     generate_unvalidated_schema,
@@ -108,6 +116,7 @@ class VirtualMachine(Visitor):
     The recordset API is:
         init_recordset(name)
         append_recordset(name, record)
+        extend_recordset(name, records)
         drop_recordset(name)
 
     grouped recordset API is:
@@ -132,6 +141,16 @@ class VirtualMachine(Visitor):
         self.name_registry = NameRegistry()
         self.interpreter = ExpressionInterpreter(self.name_registry)
         self.type_checker = SemanticAnalyzer(self.name_registry)
+        # id(condition) -> (condition, compiled condition)
+        # NOTE: the condition is held to ensure the id isn't reused by another object
+        self.compiled_conditions: Dict[int, Tuple[Symbol, Callable]] = {}
+        # tuple(kind, input schemas, names) -> derived schema; ordered from least to most recently used
+        # NOTE: schemas hash by identity, and are read-only; hence a derived schema can be reused
+        # whenever it's derived from the same input schemas. Table schemas persist across statements;
+        # hence so do the schemas derived from them, e.g. the scoped schema of an aliased table, and
+        # the joined schema of aliased tables. Whereas, schemas derived from per-statement schemas,
+        # e.g. of a subquery's result, can't be reused; hence the cache is bounded, and these are evicted
+        self.derived_schemas: OrderedDict[Tuple, AbstractSchema] = OrderedDict()
         # 3. parameters to control VM behavior
         # 3.1. whether to stop a program execution on first statement failure
         self.stop_program_on_statement_failure = (
@@ -629,7 +648,10 @@ class VirtualMachine(Visitor):
             # record set schema is a scoped schema, since that contains
             # table alias info; however, the cursor requires a (simple)
             # schema
-            rs_schema = ScopedSchema.from_single_schema(schema, table_alias)
+            rs_schema = self.get_derived_schema(
+                ("scoped", schema, table_alias),
+                lambda: ScopedSchema.from_single_schema(schema, table_alias),
+            )
         else:
             rs_schema = schema
 
@@ -637,6 +659,7 @@ class VirtualMachine(Visitor):
         assert resp.success
         rsname = resp.body
 
+        append_record = self.get_recordset(rsname).append
         cursor = Cursor(self.state_manager.get_pager(), tree)
         # iterate over entire table
         while cursor.end_of_table is False:
@@ -651,7 +674,7 @@ class VirtualMachine(Visitor):
                 else record
             )
 
-            self.append_recordset(rsname, record)
+            append_record(record)
             # advance cursor
             cursor.advance()
         return Response(True, body=rsname)
@@ -739,13 +762,17 @@ class VirtualMachine(Visitor):
         # generate new result set
         rsname = resp.body
 
-        for record in self.recordset_iter(source_rsname):
-            value = self.interpreter.evaluate_over_record(
-                where_clause.condition, record
-            )
-            assert isinstance(value, bool), f"Expected bool, received {type(value)}"
-            if value:
-                self.append_recordset(rsname, record)
+        # NOTE: the condition is evaluated over the entire recordset in a single batch;
+        # with cheaper predicates evaluated first
+        records = self.get_recordset(source_rsname)
+        values = self.interpreter.evaluate_over_recordset(
+            self.interpreter.reorder_predicates(where_clause.condition, schema),
+            records,
+        )
+        value_types = set(map(type, values))
+        assert value_types <= {bool}, f"Expected bool, received {value_types}"
+        # NOTE: values are a selection mask over the records; add the selected records in bulk
+        self.extend_recordset(rsname, compress(records, values))
 
         return Response(True, body=rsname)
 
@@ -769,16 +796,17 @@ class VirtualMachine(Visitor):
         if isinstance(schema, GroupedSchema):
             # this is similar to the ungrouped case;
             # but we want to remove the groups for which the condition is false
+            groups = self.get_grouped_recordset(rsname)
             for group_record in self.grouped_recordset_iter(source_rsname):
                 value = self.interpreter.evaluate_over_grouped_record(
                     having_clause.condition, group_record
                 )
                 assert isinstance(value, bool), f"Expected bool, received {type(value)}"
                 if value:
-                    for record in group_record.get_group_recordset():
-                        self.append_grouped_recordset(
-                            rsname, group_record.group_key, record
-                        )
+                    # NOTE: group keys are unique; hence the group is new
+                    groups[group_record.group_key] = list(
+                        group_record.get_group_recordset()
+                    )
             return Response(True, body=rsname)
         else:
             assert isinstance(schema, ScopedSchema)
@@ -786,6 +814,193 @@ class VirtualMachine(Visitor):
 
     # section: join clause helpers
 
+    @staticmethod
+    def extract_equijoin_keys(
+        condition,
+        left_schema: AbstractSchema,
+        right_schema: AbstractSchema,
+        left_sname: Optional[str],
+        right_sname: str,
+    ) -> Optional[Tuple[List[str], List[str], Optional[Symbol]]]:
+        """
+        Decompose a join `condition` into equi-join keys, i.e. equality predicates between
+        a column from the left source and a column from the right source, and a residual condition
+        consisting of all other predicates.
+
+        Returns (left_key_names, right_key_names, residual_condition), where the key names are
+        the names to get the key column values from left and right records, respectively; and the
+        residual condition is None, if all predicates are keys.
+        Returns None, if the condition has no equi-join keys, e.g. if it's an or-clause.
+
+        NOTE: columns of type Real are not used as keys, since reals are compared with a tolerance
+        (see REAL_EPSILON), and hence can't be hashed
+        """
+        if isinstance(condition, Comparison):
+            predicates = [condition]
+        elif isinstance(condition, AndClause):
+            predicates = condition.predicates
+        else:
+            return None
+
+        # left is either a single source (with name left_sname), or a joining of sources
+        if left_sname is not None:
+            left_aliases = {left_sname}
+        else:
+            assert isinstance(left_schema, ScopedSchema)
+            left_aliases = set(left_schema.get_table_names())
+
+        def resolve_key_column(operand) -> Optional[Tuple[bool, str, Type[DataType]]]:
+            """
+            If operand is a (hashable) column from either source, return
+            tuple(is_left_column, name used to get column value from record, column datatype)
+            """
+            if not isinstance(operand, ColumnName):
+                return None
+            alias = operand.get_parent_alias()
+            if alias == right_sname:
+                is_left, source_schema = False, right_schema
+            elif alias in left_aliases:
+                is_left, source_schema = True, left_schema
+            else:
+                return None
+            # records of a scoped source are accessed with the fully qualified name
+            name = (
+                operand.name
+                if isinstance(source_schema, ScopedSchema)
+                else operand.get_base_name()
+            )
+            column = source_schema.get_column_by_name(name)
+            if column is None or column.datatype == Real:
+                return None
+            return is_left, name, column.datatype
+
+        left_key_names = []
+        right_key_names = []
+        residual_predicates = []
+        for predicate in predicates:
+            if (
+                isinstance(predicate, Comparison)
+                and predicate.operator == ComparisonOp.Equal
+            ):
+                left_key = resolve_key_column(predicate.left_op)
+                right_key = resolve_key_column(predicate.right_op)
+                # NOTE: keys must have the same datatype, so that keys are orderable
+                if (
+                    left_key is not None
+                    and right_key is not None
+                    and left_key[0] != right_key[0]
+                    and left_key[2] == right_key[2]
+                ):
+                    # the operands reference different sources; order them (left, right)
+                    if right_key[0]:
+                        left_key, right_key = right_key, left_key
+                    left_key_names.append(left_key[1])
+                    right_key_names.append(right_key[1])
+                    continue
+            residual_predicates.append(predicate)
+
+        if not left_key_names:
+            return None
+
+        if not residual_predicates:
+            residual = None
+        elif len(residual_predicates) == 1:
+            residual = residual_predicates[0]
+        else:
+            residual = AndClause(residual_predicates)
+        return left_key_names, right_key_names, residual
+
+    @staticmethod
+    def hash_join_probe(
+        build_rows: RecordSet,
+        probe_key_names: List[str],
+        build_key_names: List[str],
+    ) -> Callable[[Any], Iterable]:
+        """
+        Build a hash table over `build_rows` on their join key, and return a probe function
+        that returns (index, build_rec) pairs whose join key matches that of a probing record.
+        Typically, the build side is the right side, and the probing records are left records.
+
+        NOTE: the index is tracked to handle un-joined right records in outer joins
+        """
+        # key -> [(index, build_rec)]
+        build = {}
+        if len(build_key_names) == 1:
+            # NOTE: for a single key column, the key is the column value itself, rather than
+            # a 1-tuple; this avoids creating a tuple per record, for both building and probing
+            build_key_name = build_key_names[0]
+            probe_key_name = probe_key_names[0]
+            for index, build_rec in enumerate(build_rows):
+                build.setdefault(build_rec.get(build_key_name), []).append(
+                    (index, build_rec)
+                )
+
+            def probe(probe_rec) -> Iterable:
+                return build.get(probe_rec.get(probe_key_name), ())
+
+            return probe
+
+        for index, build_rec in enumerate(build_rows):
+            key = tuple(build_rec.get(name) for name in build_key_names)
+            build.setdefault(key, []).append((index, build_rec))
+
+        def probe(probe_rec) -> Iterable:
+            key = tuple(probe_rec.get(name) for name in probe_key_names)
+            return build.get(key, ())
+
+        return probe
+
+    @staticmethod
+    def merge_join_probe(
+        left_rows: RecordSet,
+        right_rows: RecordSet,
+        left_key_names: List[str],
+        right_key_names: List[str],
+    ) -> Tuple[List, Callable[[Any], Iterable]]:
+        """
+        Sort both `left_rows` and `right_rows` on their join key, and return
+        tuple(sorted left records, probe function). When the probe function is called with the
+        left records in sorted order, it returns (index, right_rec) pairs whose join key matches
+        that of the left record, by advancing a cursor over the sorted right records.
+
+        NOTE: None values are ordered before all other values
+        """
+
+        def sort_key(record, key_names: List[str]) -> Tuple:
+            return tuple(
+                (value is not None, value)
+                for value in (record.get(name) for name in key_names)
+            )
+
+        sorted_left = sorted(left_rows, key=lambda rec: sort_key(rec, left_key_names))
+        # list of (sort key, index, right_rec) sorted on sort key
+        sorted_right = sorted(
+            (
+                (sort_key(right_rec, right_key_names), index, right_rec)
+                for index, right_rec in enumerate(right_rows)
+            ),
+            key=itemgetter(0),
+        )
+        num_right = len(sorted_right)
+        # position of first right record with key not less than the last probed key
+        position = 0
+
+        def probe(left_rec) -> Iterable:
+            nonlocal position
+            key = sort_key(left_rec, left_key_names)
+            while position < num_right and sorted_right[position][0] < key:
+                position += 1
+            # NOTE: the cursor isn't advanced past the matching run, since the
+            # next left record may have the same key
+            matches = []
+            end = position
+            while end < num_right and sorted_right[end][0] == key:
+                matches.append((sorted_right[end][1], sorted_right[end][2]))
+                end += 1
+            return matches
+
+        return sorted_left, probe
+
     def join_recordset(
         self,
         join_clause,
@@ -811,52 +1026,136 @@ class VirtualMachine(Visitor):
         """
         left_schema = self.get_recordset_schema(left_rsname)
         right_schema = self.get_recordset_schema(right_rsname)
-        schema = ScopedSchema.from_schemas(
-            left_schema, right_schema, left_sname, right_sname
+        schema = self.get_derived_schema(
+            ("joined", left_schema, right_schema, left_sname, right_sname),
+            lambda: ScopedSchema.from_schemas(
+                left_schema, right_schema, left_sname, right_sname
+            ),
         )
         resp = self.init_recordset(schema)
         assert resp.success
         rsname = resp.body
 
-        left_iter = self.recordset_iter(left_rsname)
+        # determine whether the join can be evaluated as a hash join, i.e. the condition
+        # has equality predicates between a left and a right column
+        # NOTE: cross joins don't have a condition
+        condition = None
+        equijoin_keys = None
+        if join_clause.join_type != JoinType.Cross:
+            condition = join_clause.condition
+            equijoin_keys = self.extract_equijoin_keys(
+                condition, left_schema, right_schema, left_sname, right_sname
+            )
+
+        # NOTE: the left and right recordsets are iterated multiple times; fetch them once
+        left_rows = self.get_recordset(left_rsname)
+        right_rows = self.get_recordset(right_rsname)
+        # whether the hash table is built on the left side, i.e. left records are candidates for right records
+        build_left = False
+
+        if equijoin_keys is not None:
+            left_key_names, right_key_names, condition = equijoin_keys
+            if len(left_rows) + len(right_rows) > SORT_MERGE_JOIN_THRESHOLD:
+                left_rows, probe = self.merge_join_probe(
+                    left_rows, right_rows, left_key_names, right_key_names
+                )
+            elif join_clause.join_type == JoinType.Inner and len(left_rows) < len(
+                right_rows
+            ):
+                # NOTE: an inner join is symmetric in its sides; hence build the hash table
+                # on the smaller, i.e. left, side, and probe it with right records
+                build_left = True
+                probe = self.hash_join_probe(left_rows, right_key_names, left_key_names)
+            else:
+                probe = self.hash_join_probe(
+                    right_rows, left_key_names, right_key_names
+                )
+
+        else:
+            # nested loop join; every right record is a candidate for every left record
+            def probe(left_rec) -> Iterable:
+                return enumerate(right_rows)
+
+        # NOTE: the condition is evaluated for each candidate pair; compile it once
+        evaluate_condition = None
+        if condition is not None:
+            # NOTE: column names are resolved to a side of the view (and its schema) once
+            evaluate_condition = self.get_compiled_condition(
+                condition,
+                schema,
+                lambda folded_condition: self.interpreter.compile_join_condition(
+                    folded_condition,
+                    schema,
+                    left_schema,
+                    right_schema,
+                    left_sname,
+                    right_sname,
+                ),
+            )
+
+        # NOTE: the condition is evaluated over a view of the candidate pair; only
+        # matching pairs are materialized into a ScopedRecord
+        view = JoinedRecordView(left_sname, right_sname)
+
+        def is_match(left_rec, right_rec) -> bool:
+            """Evaluate any (residual) condition on candidate pair"""
+            if evaluate_condition is None:
+                return True
+            view.set_records(left_rec, right_rec)
+            return evaluate_condition(view)
+
+        # NOTE: un-joined records in outer joins are joined with a null record; since
+        # records are read-only, a single null record is shared by all un-joined records
+        null_left_rec = None
+        null_right_rec = None
+        if join_clause.join_type in (JoinType.LeftOuter, JoinType.FullOuter):
+            null_right_rec = create_null_record(right_schema)
+        if join_clause.join_type in (JoinType.RightOuter, JoinType.FullOuter):
+            null_left_rec = create_null_record(left_schema)
+
+        append_record = self.get_recordset(rsname).append
+        left_iter = iter(left_rows)
         # inner join
         if join_clause.join_type == JoinType.Inner:
-            for left_rec in left_iter:
-                # for each left record we need to iterate over each right_record
-                right_iter = self.recordset_iter(right_rsname)
-                for right_rec in right_iter:
+
+            def candidate_pairs() -> Iterable:
+                """Generate (left_rec, right_rec) candidate pairs"""
+                if build_left:
+                    for right_rec in right_rows:
+                        for _, left_rec in probe(right_rec):
+                            yield left_rec, right_rec
+                else:
+                    for left_rec in left_iter:
+                        # for each left record we need to iterate over each candidate right_record
+                        for _, right_rec in probe(left_rec):
+                            yield left_rec, right_rec
+
+            for left_rec, right_rec in candidate_pairs():
+                if is_match(left_rec, right_rec):
+                    # join condition matched
                     record = ScopedRecord.from_records(
                         left_rec, right_rec, left_sname, right_sname, schema
                     )
-                    if self.interpreter.evaluate_over_record(
-                        join_clause.condition, record
-                    ):
-                        # join condition matched
-                        self.append_recordset(rsname, record)
+                    append_record(record)
 
         elif join_clause.join_type == JoinType.LeftOuter:
             for left_rec in left_iter:
                 # there should be at least one record each left record
                 left_record_added = False
-                right_iter = self.recordset_iter(right_rsname)
-                for right_rec in right_iter:
-                    record = ScopedRecord.from_records(
-                        left_rec, right_rec, left_sname, right_sname, schema
-                    )
-                    if self.interpreter.evaluate_over_record(
-                        join_clause.condition, record
-                    ):
+                for _, right_rec in probe(left_rec):
+                    if is_match(left_rec, right_rec):
                         # join condition matched
-                        self.append_recordset(rsname, record)
+                        record = ScopedRecord.from_records(
+                            left_rec, right_rec, left_sname, right_sname, schema
+                        )
+                        append_record(record)
                         left_record_added = True
                 if not left_record_added:
                     # add a null right record
-                    # create and join records
-                    right_rec = create_null_record(right_schema)
                     record = ScopedRecord.from_records(
-                        left_rec, right_rec, left_sname, right_sname, schema
+                        left_rec, null_right_rec, left_sname, right_sname, schema
                     )
-                    self.append_recordset(rsname, record)
+                    append_record(record)
 
         elif join_clause.join_type == JoinType.RightOuter:
             # there should be at least one record for each right record
@@ -864,74 +1163,66 @@ class VirtualMachine(Visitor):
             # index positions records in the right record set, and whether they have been joined.
             # this is problematic because it assumes the iter order of records in a recordset
             # will be the same, which isn't explicitly part of the recordset API
-            right_joined_index = [False for _ in self.recordset_iter(right_rsname)]
+            right_joined_index = [False] * len(right_rows)
             for left_rec in left_iter:
-                right_iter = self.recordset_iter(right_rsname)
-                for index, right_rec in enumerate(right_iter):
-                    record = ScopedRecord.from_records(
-                        left_rec, right_rec, left_sname, right_sname, schema
-                    )
-                    if self.interpreter.evaluate_over_record(
-                        join_clause.condition, record
-                    ):
+                for index, right_rec in probe(left_rec):
+                    if is_match(left_rec, right_rec):
                         # join condition matched
-                        self.append_recordset(rsname, record)
+                        record = ScopedRecord.from_records(
+                            left_rec, right_rec, left_sname, right_sname, schema
+                        )
+                        append_record(record)
                         right_joined_index[index] = True
 
             # handle any un-joined right records
-            for index, right_rec in enumerate(self.recordset_iter(right_rsname)):
+            for index, right_rec in enumerate(right_rows):
                 if right_joined_index[index]:
                     continue
-                left_rec = create_null_record(left_schema)
                 record = ScopedRecord.from_records(
-                    left_rec, right_rec, left_sname, right_sname, schema
+                    null_left_rec, right_rec, left_sname, right_sname, schema
                 )
-                self.append_recordset(rsname, record)
+                append_record(record)
 
         elif join_clause.join_type == JoinType.FullOuter:
             # there should be atleast one record for each left and right record
-            left_record_added = False
-            right_joined_index = [False for _ in self.recordset_iter(right_rsname)]
+            right_joined_index = [False] * len(right_rows)
             for left_rec in left_iter:
-                right_iter = self.recordset_iter(right_rsname)
-                for index, right_rec in enumerate(right_iter):
-                    record = ScopedRecord.from_records(
-                        left_rec, right_rec, left_sname, right_sname, schema
-                    )
-                    if self.interpreter.evaluate_over_record(
-                        join_clause.condition, record
-                    ):
+                left_record_added = False
+                for index, right_rec in probe(left_rec):
+                    if is_match(left_rec, right_rec):
                         # join condition matched
-                        self.append_recordset(rsname, record)
+                        record = ScopedRecord.from_records(
+                            left_rec, right_rec, left_sname, right_sname, schema
+                        )
+                        append_record(record)
                         left_record_added = True
                         right_joined_index[index] = True
                 if not left_record_added:
                     # add a null right record
-                    # create and join records
-                    right_rec = create_null_record(right_schema)
                     record = ScopedRecord.from_records(
-                        left_rec, right_rec, left_sname, right_sname, schema
+                        left_rec, null_right_rec, left_sname, right_sname, schema
                     )
-                    self.append_recordset(rsname, record)
+                    append_record(record)
             # handle any un-joined right records
-            for index, right_rec in self.recordset_iter(right_rsname):
+            for index, right_rec in enumerate(right_rows):
                 if right_joined_index[index]:
                     continue
-                left_rec = create_null_record(left_schema)
                 record = ScopedRecord.from_records(
-                    left_rec, right_rec, left_sname, right_sname, schema
+                    null_left_rec, right_rec, left_sname, right_sname, schema
                 )
-                self.append_recordset(rsname, record)
+                append_record(record)
 
         else:
             assert join_clause.join_type == JoinType.Cross
-            for left_rec in left_iter:
-                right_iter = self.recordset_iter(right_rsname)
-                for right_rec in right_iter:
-                    record = ScopedRecord.from_records(
-                        left_rec, right_rec, left_sname, right_sname, schema
-                    )
-                    self.append_recordset(rsname, record)
+            # NOTE: every pair is in the output; generate pairs with product, and add them in bulk
+            from_records = ScopedRecord.from_records
+            self.extend_recordset(
+                rsname,
+                [
+                    from_records(left_rec, right_rec, left_sname, right_sname, schema)
+                    for left_rec, right_rec in product(left_iter, right_rows)
+                ],
+            )
 
         return Response(True, body=rsname)
 
@@ -942,23 +1233,31 @@ class VirtualMachine(Visitor):
         # generate grouped schema
 
         source_schema = self.get_recordset_schema(source_rsname)
-        resp = make_grouped_schema(source_schema, group_by_clause.columns)
-        assert resp.success
-        grouped_schema = resp.body
+
+        def make_schema() -> GroupedSchema:
+            resp = make_grouped_schema(source_schema, group_by_clause.columns)
+            assert resp.success
+            return resp.body
+
+        group_by_names = tuple(column.name for column in group_by_clause.columns)
+        grouped_schema = self.get_derived_schema(
+            ("grouped", source_schema, group_by_names), make_schema
+        )
 
         # init new grouped-recordset
         resp = self.init_grouped_recordset(grouped_schema)
         assert resp.success
         rsname = resp.body
 
-        # iterate over records, get group-key, add record to group
-        for record in self.recordset_iter(source_rsname):
-            # get group-key
-            group_values = []
-            for col in grouped_schema.group_by_columns:
-                group_values.append(record.get(col.name))
-            group_key = tuple(group_values)
-            self.append_grouped_recordset(rsname, group_key, record)
+        # iterate over records, and group-keys, add record to group
+        # NOTE: the group-keys are generated by zipping the group-by columns
+        records = self.get_recordset(source_rsname)
+        group_keys = zip(
+            *[records.column(col.name) for col in grouped_schema.group_by_columns]
+        )
+        add_group = self.get_grouped_recordset(rsname).setdefault
+        for record, group_key in zip(records, group_keys):
+            add_group(group_key, []).append(record)
 
         return Response(True, body=rsname)
 
@@ -1150,9 +1449,12 @@ class VirtualMachine(Visitor):
             )
         return Response(True, body=generators)
 
-    def generate_value_generators_over_recordset(self, selectables: List) -> Response:
+    def generate_value_generators_over_recordset(
+        self, selectables: List, schema: Union[SimpleSchema, ScopedSchema]
+    ) -> Response:
         """
         Return Response[List[Generators]]
+        :param schema: schema of the records that values are generated from
         """
         generators = []
         for selectable in selectables:
@@ -1162,18 +1464,24 @@ class VirtualMachine(Visitor):
                 )
             elif isinstance(selectable, ColumnName):
                 generators.append(
-                    ValueGeneratorFromRecordOverExpr(selectable, self.interpreter)
+                    ValueGeneratorFromRecordOverExpr(
+                        selectable, self.interpreter, schema
+                    )
                 )
             elif isinstance(selectable, Literal):
                 generators.append(
-                    ValueGeneratorFromRecordOverExpr(selectable, self.interpreter)
+                    ValueGeneratorFromRecordOverExpr(
+                        selectable, self.interpreter, schema
+                    )
                 )
             else:
                 # expression
                 assert isinstance(selectable, Expr)
                 # NOTE: selectable can be arbitrary algebraic expression, including columns
                 generators.append(
-                    ValueGeneratorFromRecordOverExpr(selectable, self.interpreter)
+                    ValueGeneratorFromRecordOverExpr(
+                        selectable, self.interpreter, schema
+                    )
                 )
         return Response(True, body=generators)
 
@@ -1191,8 +1499,10 @@ class VirtualMachine(Visitor):
                 )
             else:
                 # this is unexpected
-                breakpoint()
-                return Response(False)
+                return Response(
+                    False,
+                    error_message=f"Unexpected selectable [{selectable}] over grouped recordset",
+                )
 
         return Response(True, body=generators)
 
@@ -1259,7 +1569,9 @@ class VirtualMachine(Visitor):
         out_schema = resp.body
 
         # 2. generate output value generators
-        resp = self.generate_value_generators_over_recordset(select_clause.selectables)
+        resp = self.generate_value_generators_over_recordset(
+            select_clause.selectables, source_schema
+        )
         if not resp.success:
             return Response(
                 False,
@@ -1273,17 +1585,20 @@ class VirtualMachine(Visitor):
         out_rsname = resp.body
 
         out_column_names = [col.name for col in out_schema.columns]
+        # NOTE: these are invariant across records; hence bound once, outside the loop
+        get_value_funcs = [val_gen.get_value for val_gen in value_generators]
+        append_record = self.get_recordset(out_rsname).append
         # populate output resultset
         for record in self.recordset_iter(source_rsname):
             # get value, one for each output column
-            value_list = [val_gen.get_value(record) for val_gen in value_generators]
+            value_list = [get_value(record) for get_value in get_value_funcs]
             # convert column values to a record
             resp = create_record_from_raw_values(
                 out_column_names, value_list, out_schema
             )
             assert resp.success
             out_record = resp.body
-            self.append_recordset(out_rsname, out_record)
+            append_record(out_record)
 
         return Response(True, body=out_rsname)
 
@@ -1293,6 +1608,8 @@ class VirtualMachine(Visitor):
         """
         This is a select on a grouped source
         """
+        # NOTE: the source schema is the schema of each group; it's looked up once
+        # here, rather than once per group
         source_schema = self.get_recordset_schema(source_rsname)
         assert isinstance(source_schema, GroupedSchema)
         resp = self.generate_output_schema_grouped_source(
@@ -1323,23 +1640,20 @@ class VirtualMachine(Visitor):
         out_rsname = resp.body
 
         out_column_names = [col.name for col in out_schema.columns]
+        # NOTE: these are invariant across groups; hence bound once, outside the loop
+        get_value_funcs = [val_gen.get_value for val_gen in value_generators]
+        append_record = self.get_recordset(out_rsname).append
         # populate output resultset
         for grouped_record in self.grouped_recordset_iter(source_rsname):
             # get value, one for each output column
-            group_schema = self.state_manager.get_grouped_recordset_schema(
-                source_rsname
-            )
-            assert isinstance(group_schema, GroupedSchema)
-            value_list = [
-                val_gen.get_value(grouped_record) for val_gen in value_generators
-            ]
+            value_list = [get_value(grouped_record) for get_value in get_value_funcs]
             # convert column values to a record
             resp = create_record_from_raw_values(
                 out_column_names, value_list, out_schema
             )
             assert resp.success
             out_record = resp.body
-            self.append_recordset(out_rsname, out_record)
+            append_record(out_record)
 
         return Response(True, body=out_rsname)
 
@@ -1362,8 +1676,7 @@ class VirtualMachine(Visitor):
         # sort
         sorted_records = self.quicksort(records, order_by_clause)
         # add to resultset
-        for record in sorted_records:
-            self.append_recordset(rsname, record)
+        self.extend_recordset(rsname, sorted_records)
 
         return Response(True, body=rsname)
 
@@ -1377,10 +1690,9 @@ class VirtualMachine(Visitor):
         assert resp.success
         # generate new result set
         rsname = resp.body
-        for index, record in enumerate(self.recordset_iter(source_rsname)):
-            if index >= limit_clause.limit.value:
-                break
-            self.append_recordset(rsname, record)
+        self.extend_recordset(
+            rsname, islice(self.recordset_iter(source_rsname), limit_clause.limit.value)
+        )
         return Response(True, body=rsname)
 
     # section: scope management
@@ -1394,6 +1706,57 @@ class VirtualMachine(Visitor):
 
     def end_scope(self):
         self.state_manager.end_scope()
+        # NOTE: conditions are compiled per statement
+        self.compiled_conditions.clear()
+        self.interpreter.clear_operation_plans()
+
+    # section: derived schemas
+
+    def get_derived_schema(
+        self, key: Tuple, make_schema: Callable[[], AbstractSchema]
+    ) -> AbstractSchema:
+        """
+        Return schema derived from the inputs in `key`; the schema is only
+        created, via `make_schema`, the first time it's derived from these inputs
+        (unless it has since been evicted)
+        """
+        schema = self.derived_schemas.get(key)
+        if schema is not None:
+            self.derived_schemas.move_to_end(key)
+            return schema
+        schema = make_schema()
+        self.derived_schemas[key] = schema
+        if len(self.derived_schemas) > DERIVED_SCHEMA_CACHE_SIZE:
+            # evict least recently used
+            self.derived_schemas.popitem(last=False)
+        return schema
+
+    # section: compiled conditions
+
+    def get_compiled_condition(
+        self,
+        condition: Symbol,
+        schema: AbstractSchema,
+        compile_condition: Callable[[Symbol], Callable],
+    ) -> Callable:
+        """
+        Return compiled `condition`, over records with `schema`; the condition is compiled, via
+        `compile_condition`, on first access, and cached until the end of the scope. The condition's
+        constants are folded, and its cheap predicates are moved first, before it's compiled.
+        NOTE: a given condition must always be compiled the same way, i.e. over the same schema
+        """
+        entry = self.compiled_conditions.get(id(condition))
+        if entry is None or entry[0] is not condition:
+            entry = (
+                condition,
+                compile_condition(
+                    self.interpreter.reorder_predicates(
+                        self.interpreter.fold_constants(condition), schema
+                    )
+                ),
+            )
+            self.compiled_conditions[id(condition)] = entry
+        return entry[1]
 
     # section: record set utilities
 
@@ -1427,6 +1790,12 @@ class VirtualMachine(Visitor):
     def append_recordset(self, name: str, record):
         return self.state_manager.append_recordset(name, record)
 
+    def extend_recordset(self, name: str, records: Iterable):
+        """
+        Append all `records` to recordset
+        """
+        return self.state_manager.extend_recordset(name, records)
+
     def append_grouped_recordset(
         self, name: str, group_key: Tuple, record: Union[SimpleRecord, ScopedRecord]
     ):
@@ -1444,6 +1813,12 @@ class VirtualMachine(Visitor):
     def drop_recordset(self, name: str):
         self.state_manager.drop_recordset(name)
 
+    def get_recordset(self, name: str) -> RecordSet:
+        return self.state_manager.get_recordset(name)
+
+    def get_grouped_recordset(self, name: str) -> GroupedRecordSet:
+        return self.state_manager.get_grouped_recordset(name)
+
     def recordset_iter(self, name: str) -> Iterable:
         """Return an iterator over recordset
         NOTE: The iterator will be consumed after one iteration
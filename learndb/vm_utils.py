@@ -1,7 +1,7 @@
 from enum import Enum, auto
 from typing import Type
 
-from .datatypes import DataType, Integer, Real, Blob, Text
+from .datatypes import DataType, Integer, Real, Blob, Text, Boolean
 from .lang_parser.symbols import SymbolicDataType
 
 
@@ -11,17 +11,21 @@ class EvalMode(Enum):
     Grouped = auto()
 
 
+# symbolic datatype -> datatype
+SYMBOLIC_TO_DATATYPE = {
+    SymbolicDataType.Integer: Integer,
+    SymbolicDataType.Real: Real,
+    SymbolicDataType.Blob: Blob,
+    SymbolicDataType.Text: Text,
+    SymbolicDataType.Boolean: Boolean,
+}
+
+
 def datatype_from_symbolic_datatype(data_type: SymbolicDataType) -> Type[DataType]:
     """
     Convert symbols.DataType to datatypes.DataType
     """
-    if data_type == SymbolicDataType.Integer:
-        return Integer
-    elif data_type == SymbolicDataType.Real:
-        return Real
-    elif data_type == SymbolicDataType.Blob:
-        return Blob
-    elif data_type == SymbolicDataType.Text:
-        return Text
-    else:
+    datatype = SYMBOLIC_TO_DATATYPE.get(data_type)
+    if datatype is None:
         raise Exception(f"Unknown type {data_type}")
+    return datatype
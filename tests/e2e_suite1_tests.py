@@ -158,6 +158,19 @@ def test_select_no_condition_mixed_type_schema():
     assert actual_keys == [1, 2]
 
 
+def test_select_no_source_function_call():
+    """
+    select a function call without a from clause
+    """
+    db = LearnDB(TEST_DB_FILE, nuke_db_file=True)
+    db.handle_input("select square(3)")
+    values = []
+    while db.get_pipe().has_msgs():
+        record = db.get_pipe().read()
+        values.extend(record.to_dict().values())
+    assert values == [9]
+
+
 def test_select_equality_simple_condition(db0):
     """
     test select with a simple equality condition
@@ -253,6 +266,149 @@ def test_select_inequality():
     assert keys == [1, 2]
 
 
+def test_select_column_column_condition():
+    """
+    condition compares two columns
+    """
+    db = LearnDB(TEST_DB_FILE, nuke_db_file=True)
+
+    db.handle_input("create table foo ( cola integer primary key, colB integer, colc integer)")
+    db.handle_input("insert into foo (cola, colb, colc) values (1, 2, 31)")
+    db.handle_input("insert into foo (cola, colb, colc) values (2, 4, 4)")
+    db.handle_input("insert into foo (cola, colb, colc) values (3, 10, 3)")
+    db.handle_input("select cola from foo where colb < colc or colc = colb")
+    keys = []
+    while db.get_pipe().has_msgs():
+        record = db.get_pipe().read()
+        keys.append(record.get("cola"))
+    assert keys == [1, 2]
+
+
+def test_select_inequality_constant_expr():
+    """
+    condition compares a column with a constant arithmetic expression
+    """
+    db = LearnDB(TEST_DB_FILE, nuke_db_file=True)
+
+    db.handle_input("create table foo ( cola integer primary key, colB integer)")
+    db.handle_input("insert into foo (cola, colb) values (1, 2)")
+    db.handle_input("insert into foo (cola, colb) values (2, 7)")
+    db.handle_input("insert into foo (cola, colb) values (3, 10)")
+    db.handle_input("select f.cola from foo f where f.colb > 1 + 2 * 3 and 2 < 3")
+    keys = []
+    while db.get_pipe().has_msgs():
+        record = db.get_pipe().read()
+        keys.append(record.get("f.cola"))
+    assert keys == [3]
+
+
+def test_select_arithmetic_condition():
+    """
+    condition has arithmetic and function calls over columns
+    """
+    db = LearnDB(TEST_DB_FILE, nuke_db_file=True)
+
+    db.handle_input("create table foo ( cola integer primary key, colB integer)")
+    db.handle_input("insert into foo (cola, colb) values (1, 2)")
+    db.handle_input("insert into foo (cola, colb) values (2, 7)")
+    db.handle_input("insert into foo (cola, colb) values (3, 10)")
+    db.handle_input("select cola from foo where colb * 2 - cola > 11 and square(colb) < 50")
+    keys = []
+    while db.get_pipe().has_msgs():
+        record = db.get_pipe().read()
+        keys.append(record.get("cola"))
+    assert keys == [2]
+
+
+def test_select_function_call_condition_first():
+    """
+    condition's function call predicate precedes a cheaper comparison predicate
+    """
+    db = LearnDB(TEST_DB_FILE, nuke_db_file=True)
+
+    db.handle_input("create table foo ( cola integer primary key, colB integer)")
+    db.handle_input("insert into foo (cola, colb) values (1, 2)")
+    db.handle_input("insert into foo (cola, colb) values (2, 7)")
+    db.handle_input("insert into foo (cola, colb) values (3, 10)")
+    db.handle_input("select cola from foo where square(colb) < 50 and cola > 1")
+    keys = []
+    while db.get_pipe().has_msgs():
+        record = db.get_pipe().read()
+        keys.append(record.get("cola"))
+    assert keys == [2]
+
+
+def test_select_short_circuit_condition():
+    """
+    the second and_clause would fail, but is never evaluated, since the first is true for all records
+    """
+    db = LearnDB(TEST_DB_FILE, nuke_db_file=True)
+
+    db.handle_input("create table foo ( cola integer primary key, colB integer)")
+    db.handle_input("insert into foo (cola, colb) values (1, 2)")
+    db.handle_input("insert into foo (cola, colb) values (2, 7)")
+    db.handle_input("select cola from foo where cola > 0 or colb / 0 > 1")
+    keys = []
+    while db.get_pipe().has_msgs():
+        record = db.get_pipe().read()
+        keys.append(record.get("cola"))
+    assert keys == [1, 2]
+
+
+def test_select_guarded_division_condition():
+    """
+    the first predicate guards the second predicate against division by zero;
+    hence the second predicate must not be evaluated before the first
+    """
+    db = LearnDB(TEST_DB_FILE, nuke_db_file=True)
+
+    db.handle_input("create table foo ( cola integer primary key, colB integer)")
+    for cola in range(1, 11):
+        db.handle_input(f"insert into foo (cola, colb) values ({cola}, {cola % 4})")
+    db.handle_input("select cola from foo where square(colb) > 0 and 10 / colb > 1")
+    keys = []
+    while db.get_pipe().has_msgs():
+        record = db.get_pipe().read()
+        keys.append(record.get("cola"))
+    assert keys == [1, 2, 3, 5, 6, 7, 9, 10]
+
+
+@pytest.mark.parametrize("condition", ["a + 0 > 1 and b > 1", "square(a) > 1 and b > 1", "a * 1 = 2 and b < 10"])
+def test_select_guarded_null_comparison_condition(condition):
+    """
+    the first predicate guards the second predicate against comparing a null column,
+    i.e. the second predicate must not be evaluated before the first
+    """
+    db = LearnDB(TEST_DB_FILE, nuke_db_file=True)
+
+    db.handle_input("create table t ( a integer primary key, b integer)")
+    db.handle_input("insert into t (a) values (1)")
+    db.handle_input("insert into t (a, b) values (2, 5)")
+    db.handle_input(f"select a from t where {condition}")
+    keys = []
+    while db.get_pipe().has_msgs():
+        record = db.get_pipe().read()
+        keys.append(record.get("a"))
+    assert keys == [2]
+
+
+def test_select_column_column_comparison():
+    """
+    selectable is a comparison between two columns
+    """
+    db = LearnDB(TEST_DB_FILE, nuke_db_file=True)
+
+    db.handle_input("create table foo ( cola integer primary key, colB integer)")
+    db.handle_input("insert into foo (cola, colb) values (1, 2)")
+    db.handle_input("insert into foo (cola, colb) values (3, 2)")
+    db.handle_input("select cola, colb > cola from foo")
+    values = []
+    while db.get_pipe().has_msgs():
+        record = db.get_pipe().read()
+        values.append((record.at_index(0), record.at_index(1)))
+    assert values == [(1, True), (3, False)]
+
+
 def test_select_on_real_column():
     db = LearnDB(TEST_DB_FILE, nuke_db_file=True)
     statements = [
@@ -300,6 +456,33 @@ def test_select_group_by():
     assert values == [(2, 1), (3, 2)]
 
 
+def test_select_group_by_repeated_aggregate():
+    """
+    Group by, with multiple aggregates over the same column
+    """
+
+    db = LearnDB(TEST_DB_FILE, nuke_db_file=True)
+
+    commands = [
+        "create table items ( custid integer primary key, country integer)",
+        "insert into items (custid, country) values (10, 1)",
+        "insert into items (custid, country) values (20, 1)",
+        "insert into items (custid, country) values (100, 2)",
+        "insert into items (custid, country) values (200, 2)",
+        "insert into items (custid, country) values (300, 2)",
+        "select count(custid), country, count(custid) + 1 from items group by country",
+    ]
+
+    for cmd in commands:
+        resp = db.handle_input(cmd)
+        assert resp.success, f"{cmd} failed with {resp.error_message}"
+
+    pipe = db.get_pipe()
+    assert pipe.has_msgs()
+    values = read_columns_from_pipe(pipe, [0, 1, 2])
+    assert values == [(2, 1, 3), (3, 2, 4)]
+
+
 def test_select_group_by_having():
 
     commands = [
@@ -387,6 +570,35 @@ def test_inner_join():
     assert keys == [101, 102]
 
 
+def test_inner_join_compound_condition():
+    """
+    join condition with an equality predicate between sources, and a residual predicate
+    """
+    db = LearnDB(TEST_DB_FILE, nuke_db_file=True)
+    db.nuke_dbfile()
+
+    # create table
+    db.handle_input("create table foo ( cola integer primary key, colb integer, colc integer)")
+    db.handle_input("create table bar ( colx integer primary key, coly integer, colz integer)")
+    # insert into table
+    db.handle_input("insert into foo (cola, colb, colc) values (1, 2, 3)")
+    db.handle_input("insert into foo (cola, colb, colc) values (2, 4, 6)")
+    db.handle_input("insert into foo (cola, colb, colc) values (3, 10, 8)")
+    db.handle_input("insert into foo (cola, colb, colc) values (4, 10, 100)")
+    db.handle_input("insert into bar (colx, coly, colz) values (101, 10, 80)")
+    db.handle_input("insert into bar (colx, coly, colz) values (102, 4, 90)")
+    db.handle_input("insert into bar (colx, coly, colz) values (103, 10, 90)")
+    # select
+    db.handle_input("select f.cola, b.colx from foo f join bar b on b.coly = f.colb and f.colc < b.colz")
+
+    keys = []
+    while db.get_pipe().has_msgs():
+        record = db.get_pipe().read()
+        keys.append((record.get("f.cola"), record.get("b.colx")))
+    keys.sort()
+    assert keys == [(2, 102), (3, 101), (3, 103)]
+
+
 def test_left_join():
     """
     test left-outer join
@@ -419,6 +631,103 @@ def test_left_join():
         assert expected_key in keys
 
 
+def test_full_join():
+    """
+    test full-outer join; un-joined records from either side are joined with a null record
+    :return:
+    """
+    db = LearnDB(TEST_DB_FILE, nuke_db_file=True)
+    db.nuke_dbfile()
+
+    # create table
+    db.handle_input("create table foo ( cola integer primary key, colb integer, colc integer)")
+    db.handle_input("create table bar ( colx integer primary key, coly integer, colz integer)")
+    # insert into table
+    db.handle_input("insert into foo (cola, colb, colc) values (1, 4, 3)")
+    db.handle_input("insert into foo (cola, colb, colc) values (2, 2, 6)")
+    db.handle_input("insert into foo (cola, colb, colc) values (3, 10, 8)")
+    db.handle_input("insert into bar (colx, coly, colz) values (101, 10, 80)")
+    db.handle_input("insert into bar (colx, coly, colz) values (102, 4, 90)")
+    db.handle_input("insert into bar (colx, coly, colz) values (103, 7, 90)")
+    # select
+    db.handle_input("select f.cola, b.colx from foo f full join bar b on f.colb = b.coly")
+
+    keys = []
+    while db.get_pipe().has_msgs():
+        record = db.get_pipe().read()
+        keys.append((record.get("f.cola"), record.get("b.colx")))
+    # create a set, because we can't sort tuples of ints and None
+    assert len(keys) == 4
+    assert set(keys) == {(1, 102), (2, None), (3, 101), (None, 103)}
+
+
+@pytest.mark.parametrize("join_type", ["inner", "left", "right", "full"])
+@pytest.mark.parametrize("condition", ["f.colb = b.coly", "f.colb = b.coly and f.colc < b.colz"])
+def test_sort_merge_join(monkeypatch, join_type, condition):
+    """
+    a sort-merge join, i.e. a join over inputs larger than SORT_MERGE_JOIN_THRESHOLD, should
+    return the same records as a hash join; incl. over duplicate and null join keys.
+    NOTE: the threshold is lowered, since a table can't hold enough records to exceed it
+    """
+    db = LearnDB(TEST_DB_FILE, nuke_db_file=True)
+    db.nuke_dbfile()
+
+    db.handle_input("create table foo ( cola integer primary key, colb integer, colc integer)")
+    db.handle_input("create table bar ( colx integer primary key, coly integer, colz integer)")
+    db.handle_input("insert into foo (cola, colb, colc) values (1, 4, 3)")
+    db.handle_input("insert into foo (cola, colb, colc) values (2, 2, 6)")
+    db.handle_input("insert into foo (cola, colb, colc) values (3, 4, 95)")
+    db.handle_input("insert into foo (cola, colc) values (4, 1)")
+    db.handle_input("insert into foo (cola, colb, colc) values (5, 10, 8)")
+    db.handle_input("insert into bar (colx, coly, colz) values (101, 10, 80)")
+    db.handle_input("insert into bar (colx, coly, colz) values (102, 4, 90)")
+    db.handle_input("insert into bar (colx, coly, colz) values (103, 4, 2)")
+    db.handle_input("insert into bar (colx, colz) values (104, 5)")
+    db.handle_input("insert into bar (colx, coly, colz) values (105, 7, 90)")
+
+    def select_keys():
+        db.handle_input(f"select f.cola, b.colx from foo f {join_type} join bar b on {condition}")
+        keys = []
+        while db.get_pipe().has_msgs():
+            record = db.get_pipe().read()
+            keys.append((record.get("f.cola"), record.get("b.colx")))
+        # NOTE: the join methods may order records differently; sort with nulls first
+        return sorted(keys, key=lambda key: tuple((value is not None, value) for value in key))
+
+    hash_join_keys = select_keys()
+    monkeypatch.setattr("learndb.virtual_machine.SORT_MERGE_JOIN_THRESHOLD", 0)
+    assert select_keys() == hash_join_keys
+    assert hash_join_keys
+
+
+def test_derived_schemas_reused_across_statements():
+    """
+    the schemas derived from table schemas, i.e. of aliased tables and their join, should be
+    derived once, and reused by later statements
+    """
+    db = LearnDB(TEST_DB_FILE, nuke_db_file=True)
+    db.nuke_dbfile()
+
+    db.handle_input("create table foo ( cola integer primary key, colb integer)")
+    db.handle_input("create table bar ( colx integer primary key, coly integer)")
+    db.handle_input("insert into foo (cola, colb) values (1, 4)")
+    db.handle_input("insert into bar (colx, coly) values (101, 4)")
+
+    query = "select f.cola, b.colx from foo f inner join bar b on f.colb = b.coly"
+    db.handle_input(query)
+    derived_schemas = list(db.virtual_machine.derived_schemas.values())
+    db.handle_input(query)
+    assert len(derived_schemas) == 3
+    reused = list(db.virtual_machine.derived_schemas.values())
+    assert len(reused) == 3
+    assert all(schema in reused for schema in derived_schemas)
+    keys = []
+    while db.get_pipe().has_msgs():
+        record = db.get_pipe().read()
+        keys.append((record.get("f.cola"), record.get("b.colx")))
+    assert keys == [(1, 101)]
+
+
 def test_cross_join():
     """
     test left-outer join